@@ -12,11 +12,36 @@ with autonomous decision-making capabilities.
 
 import json
 import logging
+import math
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple
+from typing import Deque, Dict, FrozenSet, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; thresholds are then checked per recommendation
+    np = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+_fromisoformat = datetime.fromisoformat
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj as UTF-8 JSON, compact or 2-space indented, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(obj)
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -38,6 +63,55 @@ class ActionType(Enum):
     CONFIGURATION_CHANGE = "configuration_change"
     MANUAL_REVIEW = "manual_review"
 
+# Severities that are never auto-resolved outside business hours
+_HIGH_SEVERITIES = frozenset({Severity.HIGH, Severity.CRITICAL})
+
+# Actions that are inherently safer for automation
+_SAFE_ACTIONS = frozenset({
+    ActionType.SCALE_UP,
+    ActionType.CONFIGURATION_CHANGE,
+    ActionType.RESTART_SERVICE
+})
+
+# Actions that need higher confidence before automation
+_RISKY_ACTIONS = frozenset({
+    ActionType.ROLLBACK,
+    ActionType.CODE_FIX
+})
+
+# Actions allowed for auto-resolution when critical services are affected
+_CRITICAL_SAFE_ACTIONS = frozenset({
+    ActionType.SCALE_UP,
+    ActionType.CONFIGURATION_CHANGE
+})
+
+class _EnumLookup(dict):
+    """Value-to-member table that rejects unknown values like the Enum constructor"""
+
+    def __init__(self, enum_cls):
+        super().__init__((member.value, member) for member in enum_cls)
+        self._enum_name = enum_cls.__name__
+
+    def __missing__(self, value):
+        raise ValueError(f"{value!r} is not a valid {self._enum_name}")
+
+# Plain dict lookups instead of Enum.__call__ on every parsed row
+_SEVERITY_BY_VALUE = _EnumLookup(Severity)
+_ACTION_TYPE_BY_VALUE = _EnumLookup(ActionType)
+
+# Positional codes used to index the vectorized threshold matrix
+_ACTION_INDEX = {action_type: i for i, action_type in enumerate(ActionType)}
+_SEVERITY_INDEX = {severity: i for i, severity in enumerate(Severity)}
+
+# Lowest confidence at which a non-critical issue is scheduled for maintenance
+_SCHEDULE_MIN_CONFIDENCE = 0.6
+
+# Assume 2 hours for human review of escalated issues
+_ESCALATION_DELTA = timedelta(hours=2)
+
+# Below this batch size the per-recommendation lookup is cheaper than building arrays
+_VECTORIZE_MIN_BATCH = 256
+
 class DecisionOutcome(Enum):
     """Possible decision outcomes"""
     AUTO_RESOLVE = "auto_resolve"
@@ -45,7 +119,7 @@ class DecisionOutcome(Enum):
     ESCALATE_HUMAN = "escalate_human"
     MONITOR_ONLY = "monitor_only"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Issue:
     """Represents a production issue"""
     id: str
@@ -54,10 +128,10 @@ class Issue:
     source: str
     timestamp: datetime
     error_count: int
-    affected_services: List[str]
+    affected_services: FrozenSet[str]
     metadata: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Recommendation:
     """AI-generated recommendation for an issue"""
     issue_id: str
@@ -69,9 +143,9 @@ class Recommendation:
     time_estimate: int  # minutes
     prerequisites: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
-    """Final decision made by the engine"""
+    """Final decision made by the engine (mutable so rate limiting can downgrade it)"""
     id: str
     issue_id: str
     recommendation: Recommendation
@@ -102,35 +176,65 @@ class DecisionEngine:
         self.confidence_threshold = config.get('confidence_threshold', 0.8)
         self.max_auto_deployments_per_hour = config.get('max_auto_deployments_per_hour', 5)
         self.business_hours_only = config.get('business_hours_only', False)
-        self.critical_services = config.get('critical_services', [])
+        self.critical_services = frozenset(config.get('critical_services', []))
         
-        # Track recent decisions for rate limiting
-        self.recent_decisions: List[Decision] = []
+        # Minimum confidence for auto-resolution per (action, severity) bucket
+        self._auto_threshold = self._build_auto_thresholds()
+        self._threshold_matrix = self._build_threshold_matrix() if np is not None else None
+        
+        # Below these confidences a recommendation can only be escalated
+        self._escalation_floor = min(_SCHEDULE_MIN_CONFIDENCE, min(self._auto_threshold.values()))
+        self._critical_escalation_floor = min(
+            min_confidence for (_, severity), min_confidence in self._auto_threshold.items()
+            if severity is Severity.CRITICAL
+        )
+        
+        # Timestamps of recent auto-resolutions (oldest first) for rate limiting.
+        # Nothing is appended once the hourly limit is reached, so the window is
+        # a ring buffer sized to the limit. A non-finite limit can't size it:
+        # float('inf') (or NaN, which never trips the >= check) means no limit,
+        # so the window is unbounded, and -inf blocks every auto-approval
+        limit = self.max_auto_deployments_per_hour
+        if math.isfinite(limit):
+            window_size: Optional[int] = max(math.ceil(limit), 0)
+        else:
+            window_size = 0 if limit < 0 else None
+        self._recent_auto_approvals: Deque[datetime] = deque(maxlen=window_size)
+        
+        # Keeps decision ids unique within a batch sharing the same timestamp
+        self._decision_seq = 0
         
         logger.info(f"Decision engine initialized with confidence threshold: {self.confidence_threshold}")
 
-    def process_ai_analysis(self, ai_response: str) -> List[Decision]:
+    def process_ai_analysis(self, ai_response: Union[str, bytes]) -> List[Decision]:
         """
         Process AI analysis results and make autonomous decisions.
         
         Args:
-            ai_response: JSON string containing AI analysis and recommendations
+            ai_response: JSON text or bytes containing AI analysis and recommendations
             
         Returns:
             List of decisions made by the engine
         """
+        # One clock read per batch; every decision in it shares this timestamp
+        now = datetime.now()
+        id_stamp = now.strftime('%Y%m%d_%H%M%S')
+        in_business_hours = not self.business_hours_only or 9 <= now.hour <= 17
+        
         try:
-            analysis = json.loads(ai_response)
-            issues = self._parse_issues(analysis.get('issues', []))
+            analysis = _json_loads(ai_response)
+            issues = self._parse_issues(analysis.get('issues', []), now)
             recommendations = self._parse_recommendations(analysis.get('recommendations', []))
             
             decisions = []
-            for recommendation in recommendations:
-                decision = self._make_decision(recommendation, issues)
+            threshold_checks = self._batch_threshold_checks(recommendations, issues)
+            for recommendation, passes_threshold in zip(recommendations, threshold_checks):
+                decision = self._make_decision(recommendation, issues, now, id_stamp,
+                                               in_business_hours, passes_threshold)
                 decisions.append(decision)
                 
             # Apply rate limiting and business rules
-            filtered_decisions = self._apply_business_rules(decisions)
+            filtered_decisions = self._apply_business_rules(decisions, now)
             
             logger.info(f"Processed {len(recommendations)} recommendations, made {len(filtered_decisions)} decisions")
             return filtered_decisions
@@ -142,21 +246,24 @@ class DecisionEngine:
             logger.error(f"Error processing AI analysis: {e}")
             return []
 
-    def _parse_issues(self, issues_data: List[Dict]) -> Dict[str, Issue]:
-        """Parse issues from AI analysis data"""
-        issues = {}
+    def _parse_issues(self, issues_data: List[Dict], now: datetime) -> Dict[str, Issue]:
+        """Parse issues from AI analysis data, defaulting missing timestamps to now"""
+        issues: Dict[str, Issue] = {}
         for issue_data in issues_data:
+            # Only format a fallback id for issues that arrive without one
+            issue_id = issue_data['id'] if 'id' in issue_data else f"issue_{len(issues)}"
+            timestamp = issue_data.get('timestamp')
             issue = Issue(
-                id=issue_data.get('id', f"issue_{len(issues)}"),
+                id=issue_id,
                 description=issue_data.get('description', 'Unknown issue'),
-                severity=Severity(issue_data.get('severity', 'medium')),
+                severity=_SEVERITY_BY_VALUE[issue_data.get('severity', 'medium')],
                 source=issue_data.get('source', 'unknown'),
-                timestamp=datetime.fromisoformat(issue_data.get('timestamp', datetime.now().isoformat())),
+                timestamp=_fromisoformat(timestamp) if timestamp is not None else now,
                 error_count=issue_data.get('error_count', 0),
-                affected_services=issue_data.get('affected_services', []),
+                affected_services=frozenset(issue_data.get('affected_services', ())),
                 metadata=issue_data.get('metadata', {})
             )
-            issues[issue.id] = issue
+            issues[issue_id] = issue
         return issues
 
     def _parse_recommendations(self, recommendations_data: List[Dict]) -> List[Recommendation]:
@@ -165,7 +272,7 @@ class DecisionEngine:
         for rec_data in recommendations_data:
             recommendation = Recommendation(
                 issue_id=rec_data.get('issue_id', 'unknown'),
-                action_type=ActionType(rec_data.get('action_type', 'manual_review')),
+                action_type=_ACTION_TYPE_BY_VALUE[rec_data.get('action_type', 'manual_review')],
                 confidence_score=rec_data.get('confidence_score', 0.0),
                 estimated_impact=rec_data.get('estimated_impact', 'Unknown'),
                 suggested_fix=rec_data.get('suggested_fix', ''),
@@ -176,13 +283,50 @@ class DecisionEngine:
             recommendations.append(recommendation)
         return recommendations
 
-    def _make_decision(self, recommendation: Recommendation, issues: Dict[str, Issue]) -> Decision:
+    def _batch_threshold_checks(self, recommendations: List[Recommendation],
+                                issues: Dict[str, Issue]) -> List[Optional[bool]]:
+        """
+        Evaluate the auto-resolution confidence thresholds for a whole batch at once.
+        
+        Args:
+            recommendations: The AI recommendations to evaluate
+            issues: Dictionary of all issues
+            
+        Returns:
+            Per-recommendation threshold results, or None entries when the batch
+            is evaluated one recommendation at a time in _make_decision
+        """
+        count = len(recommendations)
+        if self._threshold_matrix is None or count < _VECTORIZE_MIN_BATCH:
+            return [None] * count
+        
+        confidence = np.fromiter(
+            (r.confidence_score for r in recommendations), dtype=np.float64, count=count
+        )
+        actions = np.fromiter(
+            (_ACTION_INDEX[r.action_type] for r in recommendations), dtype=np.int8, count=count
+        )
+        # Recommendations without an issue are escalated before the check is used
+        severities = np.fromiter(
+            (_SEVERITY_INDEX[issues[r.issue_id].severity] if r.issue_id in issues else 0
+             for r in recommendations),
+            dtype=np.int8, count=count
+        )
+        return (confidence >= self._threshold_matrix[actions, severities]).tolist()
+
+    def _make_decision(self, recommendation: Recommendation, issues: Dict[str, Issue],
+                       now: datetime, id_stamp: str, in_business_hours: bool,
+                       passes_threshold: Optional[bool] = None) -> Decision:
         """
         Make a decision for a single recommendation.
         
         Args:
             recommendation: The AI recommendation to evaluate
             issues: Dictionary of all issues
+            now: Timestamp of the batch being processed
+            id_stamp: Batch timestamp pre-formatted for decision ids
+            in_business_hours: Whether the batch is inside the allowed deployment hours
+            passes_threshold: Precomputed threshold result from _batch_threshold_checks
             
         Returns:
             Decision object with the final determination
@@ -190,26 +334,30 @@ class DecisionEngine:
         issue = issues.get(recommendation.issue_id)
         if not issue:
             logger.warning(f"Issue {recommendation.issue_id} not found")
-            return self._create_escalation_decision(recommendation, "Issue not found")
+            return self._create_escalation_decision(recommendation, "Issue not found", now, id_stamp)
 
-        # Evaluate confidence score
-        confidence_check = recommendation.confidence_score >= self.confidence_threshold
-        
-        # Evaluate severity and risk
-        severity_check = self._evaluate_severity_risk(issue, recommendation)
-        
-        # Evaluate business impact
-        business_impact_check = self._evaluate_business_impact(issue, recommendation)
+        # Confidence, severity/risk and technical feasibility are all fixed per
+        # (action, severity) bucket, so they collapse into one threshold lookup
+        if recommendation.prerequisites:
+            # In a real implementation, check if prerequisites are actually satisfied
+            logger.info(f"Prerequisites required: {recommendation.prerequisites}")
         
-        # Evaluate technical feasibility
-        technical_check = self._evaluate_technical_feasibility(recommendation)
+        confidence = recommendation.confidence_score
+        if (confidence < self._escalation_floor or
+                (issue.severity is Severity.CRITICAL and confidence < self._critical_escalation_floor)):
+            # Can neither auto-resolve nor be scheduled; skip the remaining checks
+            passes_threshold = False
+        elif passes_threshold is None:
+            min_confidence = self._auto_threshold[(recommendation.action_type, issue.severity)]
+            passes_threshold = confidence >= min_confidence
         
         # Make final decision
-        if all([confidence_check, severity_check, business_impact_check, technical_check]):
+        if (passes_threshold and
+                self._evaluate_business_impact(issue, recommendation, in_business_hours)):
             outcome = DecisionOutcome.AUTO_RESOLVE
             auto_approved = True
             reasoning = f"All checks passed: confidence={recommendation.confidence_score:.2f}, severity={issue.severity.value}"
-        elif recommendation.confidence_score >= 0.6 and issue.severity != Severity.CRITICAL:
+        elif confidence >= _SCHEDULE_MIN_CONFIDENCE and issue.severity != Severity.CRITICAL:
             outcome = DecisionOutcome.SCHEDULE_MAINTENANCE
             auto_approved = False
             reasoning = f"Medium confidence, scheduling for maintenance window"
@@ -218,165 +366,167 @@ class DecisionEngine:
             auto_approved = False
             reasoning = f"Failed checks: confidence={recommendation.confidence_score:.2f}, severity={issue.severity.value}"
 
+        self._decision_seq += 1
         decision = Decision(
-            id=f"decision_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{recommendation.issue_id}",
+            id=f"decision_{id_stamp}_{recommendation.issue_id}_{self._decision_seq}",
             issue_id=recommendation.issue_id,
             recommendation=recommendation,
             outcome=outcome,
             confidence=recommendation.confidence_score,
             reasoning=reasoning,
-            timestamp=datetime.now(),
+            timestamp=now,
             auto_approved=auto_approved,
-            estimated_completion=datetime.now() + timedelta(minutes=recommendation.time_estimate)
+            estimated_completion=now + timedelta(minutes=recommendation.time_estimate)
         )
         
         logger.info(f"Decision made for {recommendation.issue_id}: {outcome.value} (confidence: {recommendation.confidence_score:.2f})")
         return decision
 
-    def _evaluate_severity_risk(self, issue: Issue, recommendation: Recommendation) -> bool:
+    def _build_auto_thresholds(self) -> Dict[Tuple[ActionType, Severity], float]:
         """
-        Evaluate if the issue severity and recommendation risk are acceptable for auto-resolution.
+        Materialize the minimum auto-resolution confidence for every
+        (action type, severity) combination.
+        
+        Returns:
+            Mapping of (action type, severity) to the lowest confidence score
+            that passes the confidence, severity/risk and feasibility checks
+        """
+        return {
+            (action_type, severity): max(
+                self.confidence_threshold,
+                self._severity_min_confidence(severity),
+                self._action_min_confidence(action_type)
+            )
+            for action_type in ActionType
+            for severity in Severity
+        }
+
+    def _build_threshold_matrix(self) -> "np.ndarray":
+        """Lay the threshold table out as an (action, severity) array for batch lookups"""
+        matrix = np.empty((len(ActionType), len(Severity)), dtype=np.float64)
+        for (action_type, severity), min_confidence in self._auto_threshold.items():
+            matrix[_ACTION_INDEX[action_type], _SEVERITY_INDEX[severity]] = min_confidence
+        return matrix
+
+    @staticmethod
+    def _severity_min_confidence(severity: Severity) -> float:
+        """
+        Minimum confidence for the issue severity to be acceptable for auto-resolution.
         
         Args:
-            issue: The issue being evaluated
-            recommendation: The recommendation being evaluated
+            severity: Severity of the issue being evaluated
             
         Returns:
-            True if severity/risk is acceptable for auto-resolution
+            Lowest confidence score acceptable for this severity
         """
         # Critical issues require human review unless very high confidence
-        if issue.severity == Severity.CRITICAL:
-            return recommendation.confidence_score >= 0.95
+        if severity == Severity.CRITICAL:
+            return 0.95
         
         # High severity issues need higher confidence
-        if issue.severity == Severity.HIGH:
-            return recommendation.confidence_score >= 0.85
+        if severity == Severity.HIGH:
+            return 0.85
         
         # Medium and low severity can be auto-resolved with standard confidence
-        return True
+        return 0.0
 
-    def _evaluate_business_impact(self, issue: Issue, recommendation: Recommendation) -> bool:
+    def _evaluate_business_impact(self, issue: Issue, recommendation: Recommendation,
+                                  in_business_hours: bool) -> bool:
         """
         Evaluate business impact of the issue and proposed fix.
         
         Args:
             issue: The issue being evaluated
             recommendation: The recommendation being evaluated
+            in_business_hours: False only when business_hours_only is set and the
+                batch falls outside business hours
             
         Returns:
             True if business impact is acceptable for auto-resolution
         """
-        # Check if critical services are affected
-        critical_services_affected = any(
-            service in self.critical_services 
-            for service in issue.affected_services
-        )
-        
-        if critical_services_affected:
+        # Check if critical services are affected; skip the set scan when
+        # neither side can overlap
+        if (self.critical_services and issue.affected_services and
+                not self.critical_services.isdisjoint(issue.affected_services)):
             # Critical services need higher confidence and safer actions
-            safe_actions = [ActionType.SCALE_UP, ActionType.CONFIGURATION_CHANGE]
-            return (recommendation.action_type in safe_actions and 
+            return (recommendation.action_type in _CRITICAL_SAFE_ACTIONS and 
                    recommendation.confidence_score >= 0.9)
         
         # Check business hours restriction
-        if self.business_hours_only:
-            current_hour = datetime.now().hour
-            is_business_hours = 9 <= current_hour <= 17
-            if not is_business_hours and issue.severity in [Severity.HIGH, Severity.CRITICAL]:
-                return False
+        if not in_business_hours and issue.severity in _HIGH_SEVERITIES:
+            return False
         
         return True
 
-    def _evaluate_technical_feasibility(self, recommendation: Recommendation) -> bool:
+    @staticmethod
+    def _action_min_confidence(action_type: ActionType) -> float:
         """
-        Evaluate technical feasibility of the recommendation.
+        Minimum confidence for the action to be technically feasible for auto-execution.
         
         Args:
-            recommendation: The recommendation being evaluated
+            action_type: Action proposed by the recommendation
             
         Returns:
-            True if technically feasible for auto-execution
+            Lowest confidence score acceptable for this action, or infinity
+            if the action is never auto-executed
         """
-        # Check if prerequisites are met
-        if recommendation.prerequisites:
-            # In a real implementation, check if prerequisites are actually satisfied
-            logger.info(f"Prerequisites required: {recommendation.prerequisites}")
+        if action_type in _RISKY_ACTIONS:
+            return 0.9
         
-        # Some actions are inherently safer for automation
-        safe_actions = [
-            ActionType.SCALE_UP,
-            ActionType.CONFIGURATION_CHANGE,
-            ActionType.RESTART_SERVICE
-        ]
-        
-        risky_actions = [
-            ActionType.ROLLBACK,
-            ActionType.CODE_FIX
-        ]
-        
-        if recommendation.action_type in risky_actions:
-            return recommendation.confidence_score >= 0.9
-        
-        return recommendation.action_type in safe_actions
+        return 0.0 if action_type in _SAFE_ACTIONS else float('inf')
 
-    def _apply_business_rules(self, decisions: List[Decision]) -> List[Decision]:
+    def _apply_business_rules(self, decisions: List[Decision], now: datetime) -> List[Decision]:
         """
         Apply business rules and rate limiting to decisions.
         
         Args:
             decisions: List of decisions to filter
+            now: Timestamp of the batch being processed
             
         Returns:
             Filtered list of decisions that comply with business rules
         """
-        # Clean up old decisions (older than 1 hour)
-        cutoff_time = datetime.now() - timedelta(hours=1)
-        self.recent_decisions = [
-            d for d in self.recent_decisions 
-            if d.timestamp > cutoff_time
-        ]
-        
-        # Count recent auto-approvals
-        recent_auto_approvals = sum(
-            1 for d in self.recent_decisions 
-            if d.auto_approved and d.outcome == DecisionOutcome.AUTO_RESOLVE
-        )
+        # Drop auto-approvals older than 1 hour from the sliding window
+        cutoff_time = now - timedelta(hours=1)
+        recent_auto_approvals = self._recent_auto_approvals
+        while recent_auto_approvals and recent_auto_approvals[0] <= cutoff_time:
+            recent_auto_approvals.popleft()
         
         filtered_decisions = []
-        auto_approvals_added = 0
         
         for decision in decisions:
             # Apply rate limiting for auto-approvals
             if (decision.auto_approved and 
                 decision.outcome == DecisionOutcome.AUTO_RESOLVE):
                 
-                if (recent_auto_approvals + auto_approvals_added) >= self.max_auto_deployments_per_hour:
+                if len(recent_auto_approvals) >= self.max_auto_deployments_per_hour:
                     # Convert to scheduled maintenance instead
                     decision.outcome = DecisionOutcome.SCHEDULE_MAINTENANCE
                     decision.auto_approved = False
                     decision.reasoning += " (Rate limited - converted to scheduled maintenance)"
                     logger.warning(f"Rate limited decision {decision.id}")
                 else:
-                    auto_approvals_added += 1
+                    recent_auto_approvals.append(decision.timestamp)
             
             filtered_decisions.append(decision)
-            self.recent_decisions.append(decision)
         
         logger.info(f"Applied business rules: {len(decisions)} -> {len(filtered_decisions)} decisions")
         return filtered_decisions
 
-    def _create_escalation_decision(self, recommendation: Recommendation, reason: str) -> Decision:
+    def _create_escalation_decision(self, recommendation: Recommendation, reason: str,
+                                    now: datetime, id_stamp: str) -> Decision:
         """Create an escalation decision with the given reason"""
+        self._decision_seq += 1
         return Decision(
-            id=f"escalation_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            id=f"escalation_{id_stamp}_{self._decision_seq}",
             issue_id=recommendation.issue_id,
             recommendation=recommendation,
             outcome=DecisionOutcome.ESCALATE_HUMAN,
             confidence=0.0,
             reasoning=reason,
-            timestamp=datetime.now(),
+            timestamp=now,
             auto_approved=False,
-            estimated_completion=datetime.now() + timedelta(hours=2)  # Assume 2 hours for human review
+            estimated_completion=now + _ESCALATION_DELTA
         )
 
     def get_decision_summary(self, decisions: List[Decision]) -> Dict[str, Any]:
@@ -398,10 +548,26 @@ class DecisionEngine:
                 "average_confidence": 0.0
             }
         
-        auto_approved = sum(1 for d in decisions if d.auto_approved)
-        escalations = sum(1 for d in decisions if d.outcome == DecisionOutcome.ESCALATE_HUMAN)
-        scheduled = sum(1 for d in decisions if d.outcome == DecisionOutcome.SCHEDULE_MAINTENANCE)
-        avg_confidence = sum(d.confidence for d in decisions) / len(decisions)
+        # Accumulate every statistic and the per-decision records in one pass
+        auto_approved = escalations = scheduled = 0
+        confidence_sum = 0.0
+        decision_records = []
+        for d in decisions:
+            outcome = d.outcome
+            auto_approved += d.auto_approved
+            escalations += outcome is DecisionOutcome.ESCALATE_HUMAN
+            scheduled += outcome is DecisionOutcome.SCHEDULE_MAINTENANCE
+            confidence_sum += d.confidence
+            decision_records.append({
+                "id": d.id,
+                "issue_id": d.issue_id,
+                "outcome": outcome.value,
+                "confidence": d.confidence,
+                "auto_approved": d.auto_approved,
+                "reasoning": d.reasoning,
+                "action_type": d.recommendation.action_type.value,
+                "estimated_completion": d.estimated_completion.isoformat()
+            })
         
         return {
             "total_decisions": len(decisions),
@@ -409,22 +575,23 @@ class DecisionEngine:
             "escalations": escalations,
             "scheduled": scheduled,
             "monitor_only": len(decisions) - auto_approved - escalations - scheduled,
-            "average_confidence": round(avg_confidence, 3),
-            "decisions": [
-                {
-                    "id": d.id,
-                    "issue_id": d.issue_id,
-                    "outcome": d.outcome.value,
-                    "confidence": d.confidence,
-                    "auto_approved": d.auto_approved,
-                    "reasoning": d.reasoning,
-                    "action_type": d.recommendation.action_type.value,
-                    "estimated_completion": d.estimated_completion.isoformat()
-                }
-                for d in decisions
-            ]
+            "average_confidence": round(confidence_sum / len(decisions), 3),
+            "decisions": decision_records
         }
 
+    def render_summary(self, decisions: List[Decision], pretty: bool = False) -> bytes:
+        """
+        Serialize the decision summary for Kestra outputs.
+        
+        Args:
+            decisions: List of decisions to summarize
+            pretty: Indent the JSON for humans; leave off on the workflow IO path
+            
+        Returns:
+            UTF-8 encoded JSON summary
+        """
+        return _json_dumps(self.get_decision_summary(decisions), pretty)
+
 def main():
     """
     Main function for testing the decision engine.
@@ -469,10 +636,9 @@ def main():
     # Initialize and run decision engine
     engine = DecisionEngine(config)
     decisions = engine.process_ai_analysis(json.dumps(sample_ai_response))
-    summary = engine.get_decision_summary(decisions)
     
     print("Decision Engine Results:")
-    print(json.dumps(summary, indent=2))
+    print(engine.render_summary(decisions, pretty=True).decode())
 
 if __name__ == "__main__":
     main()
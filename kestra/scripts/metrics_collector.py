@@ -11,17 +11,230 @@ Built for AI Agents Assemble Hackathon - Demonstrating measurable impact
 
 import json
 import logging
+import math
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
 import sqlite3
 import os
+import string
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib serializer
+    orjson = None  # type: ignore[assignment]
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Connection tuning for a metrics sink: WAL lets readers run alongside the
+# writer, and synchronous=NORMAL can only lose the last commit on power loss
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    # INSERT OR REPLACE must fire the business_impact delete trigger
+    "PRAGMA recursive_triggers=ON",
+)
+
+# Bumped whenever init_database needs to migrate an existing database
+#   1: business_impact_daily rollup
+#   2: timestamps stored as INTEGER Unix epoch milliseconds
+_SCHEMA_VERSION = 2
+
+# How long the 30-day business impact aggregate is reused before rescanning;
+# any business impact write invalidates it immediately
+_IMPACT_SUMMARY_TTL_SEC = 60.0
+_EXPIRED_SUMMARY = (float('-inf'), None)
+
+_MS_PER_DAY = 86_400_000
+
+# Statements on the record/summary paths are module constants so every call
+# passes the identical string and hits the connection's statement cache
+_INSERT_PERFORMANCE_METRIC_SQL = '''
+    INSERT INTO performance_metrics 
+    (timestamp, metric_type, value, unit, context)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_UPSERT_BUSINESS_IMPACT_SQL = '''
+    INSERT OR REPLACE INTO business_impact 
+    (incident_id, response_time_before, response_time_after, 
+     cost_savings, uptime_impact, confidence_score, 
+     resolution_method, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_IMPACT_DAILY_SQL = '''
+    SELECT sum_before, sum_after, sum_cost, sum_uptime, sum_conf, n, n_auto
+    FROM business_impact_daily
+    WHERE day >= ?
+'''
+
+# Impact report layout, parsed once; export_hackathon_report fills it per call
+_REPORT_TEMPLATE = string.Template("""
+# DevOps Intelligence Platform - Impact Report
+## AI Agents Assemble Hackathon Submission
+
+### 🎯 Executive Summary
+Our autonomous DevOps platform delivers measurable business impact through AI-powered incident response:
+
+### 📊 Key Performance Indicators
+- **Response Time Improvement**: $response_time
+- **Cost Savings**: $cost_savings  
+- **System Reliability**: $uptime
+- **Automation Rate**: $automation_rate
+- **AI Confidence**: $ai_confidence
+
+### 🏆 Hackathon Value Proposition
+$primary_metric translating to $business_value while maintaining $reliability through $automation.
+
+### 🛠️ Technical Achievement
+This platform seamlessly integrates:
+- **Kestra AI Agent**: Autonomous data analysis and decision making
+- **Cline CLI**: Automated code generation and fixes
+- **CodeRabbit**: Automated code review and quality assurance
+- **Vercel**: Production-ready deployment and hosting
+
+### 📈 Business Impact
+The autonomous system reduces manual DevOps overhead by 85%, enabling teams to focus on innovation rather than incident response. This represents a paradigm shift toward truly autonomous infrastructure management.
+
+Generated: $generated
+""")
+
+def _reject_unserializable(obj: Any) -> Any:
+    """json-compatible default hook: refuse anything that isn't plain JSON data"""
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# orjson serializes integers only within the signed/unsigned 64-bit range
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 64) - 1
+
+def _as_orjson_would(value: Any) -> Any:
+    """
+    Prepare a value for json.dumps so it matches orjson's output.
+    
+    NaN and infinities become None (orjson writes them as null), and
+    integers outside the 64-bit range raise TypeError as they do in orjson.
+    Dict keys get the same treatment.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, int):
+        if not _INT_MIN <= value <= _INT_MAX:
+            raise TypeError("Integer exceeds 64-bit range")
+        return value
+    if isinstance(value, dict):
+        return {_as_orjson_would(key): _as_orjson_would(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_as_orjson_would(item) for item in value]
+    return value
+
+def _dumps_context(context: Dict[str, Any]) -> str:
+    """Serialize a metric context as compact JSON text, using orjson when available
+    
+    Both paths accept the same input and write the same JSON values:
+    datetimes, dataclasses, other non-JSON objects and integers outside the
+    64-bit range raise TypeError, non-finite floats are stored as null, and
+    non-ASCII text is written as UTF-8 rather than \\u escapes. The only
+    textual difference is exponent spelling for very large or small floats
+    (orjson writes 1e16, json writes 1e+16).
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            context,
+            default=_reject_unserializable,
+            option=(orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS),
+        ).decode()
+    return json.dumps(_as_orjson_would(context), separators=(',', ':'), ensure_ascii=False,
+                      allow_nan=False, default=_reject_unserializable)
+
+# Realistic demo metrics for hackathon presentation; generate_demo_metrics
+# hands out copies so callers can't modify this template
+_DEMO_METRICS: Dict[str, Any] = {
+    "response_time_improvement": {
+        "percentage": 93.0,
+        "before_hours": 2.0,
+        "after_minutes": 8.3,
+        "description": "93.0% faster incident response"
+    },
+    "cost_savings": {
+        "total_monthly": 4167,
+        "annual_projection": 50000,
+        "description": "$50,000 annual savings projected"
+    },
+    "uptime_improvement": {
+        "current_uptime": 99.9,
+        "description": "99.9% uptime maintained"
+    },
+    "autonomous_resolution": {
+        "rate": 85.2,
+        "total_incidents": 47,
+        "autonomous_count": 40,
+        "description": "85.2% of incidents resolved autonomously"
+    },
+    "ai_confidence": {
+        "average": 87.4,
+        "description": "87.4% average AI confidence score"
+    },
+    "hackathon_summary": {
+        "primary_metric": "93% faster incident response",
+        "business_value": "$50,000 annual savings",
+        "reliability": "99.9% uptime maintained",
+        "automation": "85% autonomous resolution"
+    }
+}
+
+def _json_dumps_pretty(obj: Any) -> str:
+    """Serialize obj as 2-space indented JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+def _summarize_daily_rollup(rows: List[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+    """
+    Fold business_impact_daily rows into the 30-day summary in one pass.
+    
+    Returns:
+        avg_before, avg_after, total_savings, avg_uptime, avg_confidence,
+        total_incidents and autonomous_count by name, or None when no
+        incidents are in range
+    """
+    sum_before = sum_after = sum_cost = sum_uptime = sum_conf = 0.0
+    total = autonomous = 0
+    for row in rows:
+        sum_before += row["sum_before"]
+        sum_after += row["sum_after"]
+        sum_cost += row["sum_cost"]
+        sum_uptime += row["sum_uptime"]
+        sum_conf += row["sum_conf"]
+        total += row["n"]
+        autonomous += row["n_auto"]
+    
+    if not total:
+        return None
+    return {
+        "avg_before": sum_before / total,
+        "avg_after": sum_after / total,
+        "total_savings": sum_cost,
+        "avg_uptime": sum_uptime / total,
+        "avg_confidence": sum_conf / total,
+        "total_incidents": total,
+        "autonomous_count": autonomous
+    }
+
+def _now_ms() -> int:
+    """Current time as Unix epoch milliseconds"""
+    return time.time_ns() // 1_000_000
+
+@dataclass(slots=True)
 class PerformanceMetric:
     """Performance metric data structure"""
     timestamp: datetime
@@ -29,8 +242,18 @@ class PerformanceMetric:
     value: float
     unit: str
     context: Dict[str, Any]
+    
+    def to_row(self) -> tuple:
+        """Bind parameters for the performance_metrics insert"""
+        return (
+            int(self.timestamp.timestamp() * 1000),
+            self.metric_type,
+            self.value,
+            self.unit,
+            _dumps_context(self.context)
+        )
 
-@dataclass
+@dataclass(slots=True)
 class BusinessImpactMetric:
     """Business impact measurement"""
     incident_id: str
@@ -40,6 +263,19 @@ class BusinessImpactMetric:
     uptime_impact: float         # percentage
     confidence_score: float
     resolution_method: str       # 'autonomous' or 'manual'
+    
+    def to_row(self, created_at: int) -> tuple:
+        """Bind parameters for the business_impact upsert"""
+        return (
+            self.incident_id,
+            self.response_time_before,
+            self.response_time_after,
+            self.cost_savings,
+            self.uptime_impact,
+            self.confidence_score,
+            self.resolution_method,
+            created_at
+        )
 
 class MetricsCollector:
     """
@@ -55,103 +291,270 @@ class MetricsCollector:
     def __init__(self, db_path: str = "/tmp/devops_metrics.db"):
         """Initialize metrics collector with SQLite database"""
         self.db_path = db_path
+        # One long-lived autocommit connection shared by every call, opened by
+        # _connection(); the lock serializes access since it may be used from
+        # several threads
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        # (monotonic expiry, aggregate row) for calculate_hackathon_metrics
+        self._impact_summary: Tuple[float, Optional[Dict[str, Any]]] = _EXPIRED_SUMMARY
         self.init_database()
         
+    def close(self):
+        """Close the shared database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                
+    def _connection(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it if needed; call with the lock held
+        
+        Raises:
+            sqlite3.Error: If the database can't be opened. Callers handle this
+                like any other database error, and the next call retries.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            try:
+                conn.row_factory = sqlite3.Row
+                for pragma in _CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
+            except BaseException:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+        
     def init_database(self):
         """Initialize SQLite database for metrics storage"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._lock:
+                cursor = self._connection().cursor()
+                
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    self._create_schema(cursor)
+                except BaseException:
+                    cursor.execute("ROLLBACK")
+                    raise
+                cursor.execute("COMMIT")
             
-            # Performance metrics table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS performance_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    metric_type TEXT NOT NULL,
-                    value REAL NOT NULL,
-                    unit TEXT NOT NULL,
-                    context TEXT NOT NULL
+            logger.info("Metrics database initialized successfully")
+            
+        except sqlite3.Error as e:
+            logger.error(f"Failed to initialize database: {e}")
+            
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables, indexes and rollup triggers, migrating older databases"""
+        schema_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        legacy = schema_version < 2 and cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'business_impact'"
+        ).fetchone() is not None
+        
+        if legacy:
+            # Before version 2 timestamps were local-time ISO strings; move the
+            # old tables aside and copy them into the epoch-millisecond schema
+            for statement in (
+                "DROP TRIGGER IF EXISTS business_impact_daily_insert",
+                "DROP TRIGGER IF EXISTS business_impact_daily_delete",
+                "DROP TABLE IF EXISTS business_impact_daily",
+                "DROP INDEX IF EXISTS idx_business_impact_created_at",
+                "DROP INDEX IF EXISTS idx_performance_metrics_timestamp_type",
+                "ALTER TABLE business_impact RENAME TO business_impact_legacy",
+                "ALTER TABLE performance_metrics RENAME TO performance_metrics_legacy",
+            ):
+                cursor.execute(statement)
+        
+        # Performance metrics table; timestamp is Unix epoch milliseconds
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS performance_metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp INTEGER NOT NULL,
+                metric_type TEXT NOT NULL,
+                value REAL NOT NULL,
+                unit TEXT NOT NULL,
+                context TEXT NOT NULL
+            )
+        ''')
+        
+        # Business impact metrics table; created_at is Unix epoch milliseconds
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS business_impact (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                incident_id TEXT UNIQUE NOT NULL,
+                response_time_before REAL NOT NULL,
+                response_time_after REAL NOT NULL,
+                cost_savings REAL NOT NULL,
+                uptime_impact REAL NOT NULL,
+                confidence_score REAL NOT NULL,
+                resolution_method TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            )
+        ''')
+        
+        # Time-range indexes for the 30-day summary and per-type metric queries
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_business_impact_created_at
+            ON business_impact(created_at)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_performance_metrics_timestamp_type
+            ON performance_metrics(metric_type, timestamp)
+        ''')
+        
+        # Per-day business impact rollup so the 30-day summary reads at most
+        # 31 rows however many incidents were recorded; day counts UTC days
+        # since the Unix epoch
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS business_impact_daily (
+                day INTEGER PRIMARY KEY,
+                sum_before REAL NOT NULL,
+                sum_after REAL NOT NULL,
+                sum_cost REAL NOT NULL,
+                sum_uptime REAL NOT NULL,
+                sum_conf REAL NOT NULL,
+                n INTEGER NOT NULL,
+                n_auto INTEGER NOT NULL
+            )
+        ''')
+        
+        # The triggers keep the rollup in step with business_impact; REPLACE
+        # only fires the delete trigger with recursive_triggers enabled
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS business_impact_daily_insert
+            AFTER INSERT ON business_impact
+            BEGIN
+                INSERT INTO business_impact_daily
+                (day, sum_before, sum_after, sum_cost, sum_uptime, sum_conf, n, n_auto)
+                VALUES (
+                    NEW.created_at / 86400000,
+                    NEW.response_time_before,
+                    NEW.response_time_after,
+                    NEW.cost_savings,
+                    NEW.uptime_impact,
+                    NEW.confidence_score,
+                    1,
+                    NEW.resolution_method = 'autonomous'
                 )
+                ON CONFLICT(day) DO UPDATE SET
+                    sum_before = sum_before + excluded.sum_before,
+                    sum_after = sum_after + excluded.sum_after,
+                    sum_cost = sum_cost + excluded.sum_cost,
+                    sum_uptime = sum_uptime + excluded.sum_uptime,
+                    sum_conf = sum_conf + excluded.sum_conf,
+                    n = n + 1,
+                    n_auto = n_auto + excluded.n_auto;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS business_impact_daily_delete
+            AFTER DELETE ON business_impact
+            BEGIN
+                UPDATE business_impact_daily SET
+                    sum_before = sum_before - OLD.response_time_before,
+                    sum_after = sum_after - OLD.response_time_after,
+                    sum_cost = sum_cost - OLD.cost_savings,
+                    sum_uptime = sum_uptime - OLD.uptime_impact,
+                    sum_conf = sum_conf - OLD.confidence_score,
+                    n = n - 1,
+                    n_auto = n_auto - (OLD.resolution_method = 'autonomous')
+                WHERE day = OLD.created_at / 86400000;
+                DELETE FROM business_impact_daily
+                WHERE day = OLD.created_at / 86400000 AND n = 0;
+            END
+        ''')
+        
+        if legacy:
+            # julianday(..., 'utc') reads the stored strings as local time; the
+            # insert trigger rebuilds the rollup as the rows are copied over
+            cursor.execute('''
+                INSERT INTO performance_metrics
+                (id, timestamp, metric_type, value, unit, context)
+                SELECT 
+                    id,
+                    CAST(round((julianday(timestamp, 'utc') - 2440587.5) * 86400000) AS INTEGER),
+                    metric_type, value, unit, context
+                FROM performance_metrics_legacy
             ''')
-            
-            # Business impact metrics table
             cursor.execute('''
-                CREATE TABLE IF NOT EXISTS business_impact (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    incident_id TEXT UNIQUE NOT NULL,
-                    response_time_before REAL NOT NULL,
-                    response_time_after REAL NOT NULL,
-                    cost_savings REAL NOT NULL,
-                    uptime_impact REAL NOT NULL,
-                    confidence_score REAL NOT NULL,
-                    resolution_method TEXT NOT NULL,
-                    created_at TEXT NOT NULL
-                )
+                INSERT INTO business_impact
+                (id, incident_id, response_time_before, response_time_after,
+                 cost_savings, uptime_impact, confidence_score,
+                 resolution_method, created_at)
+                SELECT 
+                    id, incident_id, response_time_before, response_time_after,
+                    cost_savings, uptime_impact, confidence_score, resolution_method,
+                    CAST(round((julianday(created_at, 'utc') - 2440587.5) * 86400000) AS INTEGER)
+                FROM business_impact_legacy
             ''')
-            
-            conn.commit()
-            conn.close()
-            logger.info("Metrics database initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
+            cursor.execute("DROP TABLE performance_metrics_legacy")
+            cursor.execute("DROP TABLE business_impact_legacy")
+        
+        if schema_version < _SCHEMA_VERSION:
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
             
     def record_performance_metric(self, metric: PerformanceMetric):
         """Record a performance metric"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO performance_metrics 
-                (timestamp, metric_type, value, unit, context)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                metric.timestamp.isoformat(),
-                metric.metric_type,
-                metric.value,
-                metric.unit,
-                json.dumps(metric.context)
-            ))
+            with self._lock:
+                self._connection().execute(_INSERT_PERFORMANCE_METRIC_SQL, metric.to_row())
             
-            conn.commit()
-            conn.close()
             logger.info(f"Recorded metric: {metric.metric_type} = {metric.value} {metric.unit}")
             
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Failed to record performance metric: {e}")
             
     def record_business_impact(self, impact: BusinessImpactMetric):
         """Record business impact measurement"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._lock:
+                self._connection().execute(_UPSERT_BUSINESS_IMPACT_SQL,
+                                           impact.to_row(_now_ms()))
+                self._impact_summary = _EXPIRED_SUMMARY
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO business_impact 
-                (incident_id, response_time_before, response_time_after, 
-                 cost_savings, uptime_impact, confidence_score, 
-                 resolution_method, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                impact.incident_id,
-                impact.response_time_before,
-                impact.response_time_after,
-                impact.cost_savings,
-                impact.uptime_impact,
-                impact.confidence_score,
-                impact.resolution_method,
-                datetime.now().isoformat()
-            ))
-            
-            conn.commit()
-            conn.close()
             logger.info(f"Recorded business impact for incident: {impact.incident_id}")
             
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Failed to record business impact: {e}")
             
+    def record_performance_metrics(self, metrics: List[PerformanceMetric]):
+        """Record several performance metrics in a single transaction"""
+        try:
+            self._executemany_in_transaction(
+                _INSERT_PERFORMANCE_METRIC_SQL, [metric.to_row() for metric in metrics])
+            logger.info(f"Recorded {len(metrics)} performance metrics")
+            
+        except sqlite3.Error as e:
+            logger.error(f"Failed to record performance metrics: {e}")
+            
+    def record_business_impacts(self, impacts: List[BusinessImpactMetric]):
+        """Record several business impact measurements in a single transaction"""
+        try:
+            # One write time for the whole batch
+            created_at = _now_ms()
+            self._executemany_in_transaction(
+                _UPSERT_BUSINESS_IMPACT_SQL,
+                [impact.to_row(created_at) for impact in impacts])
+            with self._lock:
+                self._impact_summary = _EXPIRED_SUMMARY
+            logger.info(f"Recorded business impact for {len(impacts)} incidents")
+            
+        except sqlite3.Error as e:
+            logger.error(f"Failed to record business impacts: {e}")
+            
+    def _executemany_in_transaction(self, sql: str, rows: List[tuple]):
+        """Run sql once per row inside one write transaction, rolling back on failure"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(sql, rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            
     def calculate_hackathon_metrics(self) -> Dict[str, Any]:
         """
         Calculate key metrics for hackathon demonstration
@@ -163,30 +566,29 @@ class MetricsCollector:
         - Autonomous resolution rate
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # Get business impact data, reusing the last aggregate while it is fresh
+            with self._lock:
+                expires_at, result = self._impact_summary
+                if time.monotonic() >= expires_at:
+                    # Every incident from the UTC day 30 days back onwards
+                    cutoff_day = _now_ms() // _MS_PER_DAY - 30
+                    result = _summarize_daily_rollup(
+                        self._connection().execute(_IMPACT_DAILY_SQL, (cutoff_day,)).fetchall())
+                    self._impact_summary = (time.monotonic() + _IMPACT_SUMMARY_TTL_SEC, result)
             
-            # Get business impact data
-            cursor.execute('''
-                SELECT 
-                    AVG(response_time_before) as avg_before,
-                    AVG(response_time_after) as avg_after,
-                    SUM(cost_savings) as total_savings,
-                    AVG(uptime_impact) as avg_uptime,
-                    AVG(confidence_score) as avg_confidence,
-                    COUNT(*) as total_incidents,
-                    SUM(CASE WHEN resolution_method = 'autonomous' THEN 1 ELSE 0 END) as autonomous_count
-                FROM business_impact
-                WHERE created_at >= datetime('now', '-30 days')
-            ''')
-            
-            result = cursor.fetchone()
-            
-            if result and result[0]:
-                avg_before, avg_after, total_savings, avg_uptime, avg_confidence, total_incidents, autonomous_count = result
+            if result is not None and result["avg_before"]:
+                avg_before = result["avg_before"]
+                avg_after = result["avg_after"]
+                total_savings = result["total_savings"]
+                avg_uptime = result["avg_uptime"]
+                avg_confidence = result["avg_confidence"]
+                total_incidents = result["total_incidents"]
+                autonomous_count = result["autonomous_count"]
                 
                 # Calculate key hackathon metrics
-                response_time_improvement = ((avg_before * 60 - avg_after) / (avg_before * 60)) * 100
+                before_minutes = avg_before * 60
+                response_time_improvement = (before_minutes - avg_after) / before_minutes * 100
+                annual_savings = total_savings * 12
                 autonomous_rate = (autonomous_count / total_incidents) * 100 if total_incidents > 0 else 0
                 
                 metrics = {
@@ -198,8 +600,8 @@ class MetricsCollector:
                     },
                     "cost_savings": {
                         "total_monthly": round(total_savings, 0),
-                        "annual_projection": round(total_savings * 12, 0),
-                        "description": f"${total_savings * 12:,.0f} annual savings projected"
+                        "annual_projection": round(annual_savings, 0),
+                        "description": f"${annual_savings:,.0f} annual savings projected"
                     },
                     "uptime_improvement": {
                         "current_uptime": round(avg_uptime, 3),
@@ -217,7 +619,7 @@ class MetricsCollector:
                     },
                     "hackathon_summary": {
                         "primary_metric": f"{response_time_improvement:.0f}% faster incident response",
-                        "business_value": f"${total_savings * 12:,.0f} annual savings",
+                        "business_value": f"${annual_savings:,.0f} annual savings",
                         "reliability": f"{avg_uptime:.1f}% uptime maintained",
                         "automation": f"{autonomous_rate:.0f}% autonomous resolution"
                     }
@@ -227,48 +629,16 @@ class MetricsCollector:
                 # Generate demo metrics for hackathon presentation
                 metrics = self.generate_demo_metrics()
                 
-            conn.close()
             return metrics
             
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Failed to calculate metrics: {e}")
             return self.generate_demo_metrics()
             
     def generate_demo_metrics(self) -> Dict[str, Any]:
-        """Generate realistic demo metrics for hackathon presentation"""
-        return {
-            "response_time_improvement": {
-                "percentage": 93.0,
-                "before_hours": 2.0,
-                "after_minutes": 8.3,
-                "description": "93.0% faster incident response"
-            },
-            "cost_savings": {
-                "total_monthly": 4167,
-                "annual_projection": 50000,
-                "description": "$50,000 annual savings projected"
-            },
-            "uptime_improvement": {
-                "current_uptime": 99.9,
-                "description": "99.9% uptime maintained"
-            },
-            "autonomous_resolution": {
-                "rate": 85.2,
-                "total_incidents": 47,
-                "autonomous_count": 40,
-                "description": "85.2% of incidents resolved autonomously"
-            },
-            "ai_confidence": {
-                "average": 87.4,
-                "description": "87.4% average AI confidence score"
-            },
-            "hackathon_summary": {
-                "primary_metric": "93% faster incident response",
-                "business_value": "$50,000 annual savings",
-                "reliability": "99.9% uptime maintained",
-                "automation": "85% autonomous resolution"
-            }
-        }
+        """Return realistic demo metrics for hackathon presentation"""
+        # Every section is a flat dict of scalars, so a two-level copy is a full copy
+        return {section: dict(values) for section, values in _DEMO_METRICS.items()}
         
     def generate_sample_data(self):
         """Generate sample data for hackathon demonstration"""
@@ -306,27 +676,27 @@ class MetricsCollector:
         ]
         
         # Record sample data
-        for impact in sample_impacts:
-            self.record_business_impact(impact)
+        self.record_business_impacts(sample_impacts)
             
         # Sample performance metrics
+        now = datetime.now()
         sample_metrics = [
             PerformanceMetric(
-                timestamp=datetime.now(),
+                timestamp=now,
                 metric_type="workflow_execution_time",
                 value=127.5,
                 unit="seconds",
                 context={"workflow_id": "main-agent-workflow", "success": True}
             ),
             PerformanceMetric(
-                timestamp=datetime.now(),
+                timestamp=now,
                 metric_type="ai_analysis_time",
                 value=32.1,
                 unit="seconds", 
                 context={"confidence_score": 0.91, "sources": 5}
             ),
             PerformanceMetric(
-                timestamp=datetime.now(),
+                timestamp=now,
                 metric_type="code_generation_time",
                 value=45.8,
                 unit="seconds",
@@ -334,8 +704,7 @@ class MetricsCollector:
             )
         ]
         
-        for metric in sample_metrics:
-            self.record_performance_metric(metric)
+        self.record_performance_metrics(sample_metrics)
             
         logger.info("Sample data generation completed")
         
@@ -343,54 +712,39 @@ class MetricsCollector:
         """Export comprehensive report for hackathon judges"""
         metrics = self.calculate_hackathon_metrics()
         
-        report = f"""
-# DevOps Intelligence Platform - Impact Report
-## AI Agents Assemble Hackathon Submission
-
-### 🎯 Executive Summary
-Our autonomous DevOps platform delivers measurable business impact through AI-powered incident response:
-
-### 📊 Key Performance Indicators
-- **Response Time Improvement**: {metrics['response_time_improvement']['description']}
-- **Cost Savings**: {metrics['cost_savings']['description']}  
-- **System Reliability**: {metrics['uptime_improvement']['description']}
-- **Automation Rate**: {metrics['autonomous_resolution']['description']}
-- **AI Confidence**: {metrics['ai_confidence']['description']}
-
-### 🏆 Hackathon Value Proposition
-{metrics['hackathon_summary']['primary_metric']} translating to {metrics['hackathon_summary']['business_value']} while maintaining {metrics['hackathon_summary']['reliability']} through {metrics['hackathon_summary']['automation']}.
-
-### 🛠️ Technical Achievement
-This platform seamlessly integrates:
-- **Kestra AI Agent**: Autonomous data analysis and decision making
-- **Cline CLI**: Automated code generation and fixes
-- **CodeRabbit**: Automated code review and quality assurance
-- **Vercel**: Production-ready deployment and hosting
-
-### 📈 Business Impact
-The autonomous system reduces manual DevOps overhead by 85%, enabling teams to focus on innovation rather than incident response. This represents a paradigm shift toward truly autonomous infrastructure management.
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        
-        return report
+        summary = metrics['hackathon_summary']
+        return _REPORT_TEMPLATE.substitute(
+            response_time=metrics['response_time_improvement']['description'],
+            cost_savings=metrics['cost_savings']['description'],
+            uptime=metrics['uptime_improvement']['description'],
+            automation_rate=metrics['autonomous_resolution']['description'],
+            ai_confidence=metrics['ai_confidence']['description'],
+            primary_metric=summary['primary_metric'],
+            business_value=summary['business_value'],
+            reliability=summary['reliability'],
+            automation=summary['automation'],
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
 
 def main():
     """Main function for testing and demo data generation"""
     collector = MetricsCollector()
     
-    # Generate sample data for hackathon demonstration
-    collector.generate_sample_data()
-    
-    # Calculate and display metrics
-    metrics = collector.calculate_hackathon_metrics()
-    print("Hackathon Metrics Summary:")
-    print(json.dumps(metrics, indent=2))
-    
-    # Generate report
-    report = collector.export_hackathon_report()
-    print("\nHackathon Impact Report:")
-    print(report)
+    try:
+        # Generate sample data for hackathon demonstration
+        collector.generate_sample_data()
+        
+        # Calculate and display metrics
+        metrics = collector.calculate_hackathon_metrics()
+        print("Hackathon Metrics Summary:")
+        print(_json_dumps_pretty(metrics))
+        
+        # Generate report
+        report = collector.export_hackathon_report()
+        print("\nHackathon Impact Report:")
+        print(report)
+    finally:
+        collector.close()
 
 if __name__ == "__main__":
     main()
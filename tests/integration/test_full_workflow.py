@@ -8,16 +8,183 @@ Tests the complete end-to-end workflow from issue detection to deployment.
 Built for AI Agents Assemble Hackathon - Ensuring reliable demo execution
 """
 
-import json
+import io
 import time
-import subprocess
 import os
+import shutil
 import sys
+import concurrent.futures
+import functools
+from array import array
 from datetime import datetime
-from typing import Dict, List, Any
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import fmean
+from typing import Callable, Dict, List, Any, Optional
 
-# Add project root to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+# subprocess and json are imported where they're used, so importing this
+# module (e.g. during test collection) doesn't pay for subprocess. Deferring
+# json only helps without orjson, whose import loads json anyway
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib serializer
+    orjson = None  # type: ignore[assignment]
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DASHBOARD_DIR = PROJECT_ROOT / "dashboard"
+CLINE_SCRIPT = PROJECT_ROOT / "cline" / "scripts" / "generate_fix.sh"
+# Resolved once rather than searched on PATH for every spawn
+_BASH = shutil.which("bash") or "bash"
+
+# Simulated processing time per demo reliability run; raise it to rehearse a
+# slower presentation environment
+DEMO_SLEEP_SEC = float(os.environ.get("DEMO_SLEEP_SEC", "0.01"))
+
+RESULTS_PATH = Path("/tmp/hackathon_test_results.json")
+
+# Fixed banners for the suite output
+_SUITE_HEADER = (
+    "🏆 HACKATHON INTEGRATION TEST SUITE\n"
+    + "=" * 50 + "\n"
+    "🎯 AI Agents Assemble - WeMakeDevs\n"
+    "💰 Total Prize Value: $12,000\n"
+    "🚀 Testing all sponsor integrations...\n"
+    "\n"
+)
+_SUMMARY_HEADER = "\n" + "=" * 50 + "\n🏆 HACKATHON TEST RESULTS SUMMARY\n" + "=" * 50 + "\n"
+
+# Demo scenarios exercised by the suite
+_TEST_SCENARIOS = (
+    {
+        "name": "high_error_rate_scenario",
+        "description": "Simulate high error rate in payment service",
+        "expected_actions": ["scale_service", "investigate_logs", "notify_team"],
+        "confidence_threshold": 0.8
+    },
+    {
+        "name": "memory_leak_scenario", 
+        "description": "Simulate memory leak in user authentication",
+        "expected_actions": ["restart_service", "generate_fix", "deploy_patch"],
+        "confidence_threshold": 0.85
+    },
+    {
+        "name": "database_connection_scenario",
+        "description": "Simulate database connection issues",
+        "expected_actions": ["check_connections", "scale_database", "optimize_queries"],
+        "confidence_threshold": 0.9
+    }
+)
+
+# OSS best practice files the CodeRabbit test looks for
+_REQUIRED_OSS_FILES = (
+    "README.md", "CONTRIBUTING.md", "LICENSE", 
+    "CODE_OF_CONDUCT.md", "SECURITY.md", ".github/PULL_REQUEST_TEMPLATE.md"
+)
+
+# Simulated end-to-end workflow timings, in minutes
+_WORKFLOW_STEPS = (
+    {"step": "data_collection", "status": "completed", "duration": 2.3},
+    {"step": "ai_analysis", "status": "completed", "duration": 4.7},
+    {"step": "decision_making", "status": "completed", "duration": 1.2},
+    {"step": "code_generation", "status": "completed", "duration": 8.5},
+    {"step": "testing", "status": "completed", "duration": 3.1},
+    {"step": "deployment", "status": "completed", "duration": 5.8}
+)
+_TOTAL_WORKFLOW_DURATION = sum(step["duration"] for step in _WORKFLOW_STEPS)
+
+@functools.lru_cache(maxsize=None)
+def _exists(path: Path) -> bool:
+    """Cached Path.exists(); cleared by setup_test_environment"""
+    return path.exists()
+
+@functools.lru_cache(maxsize=None)
+def _top_level_entries() -> frozenset:
+    """Names in the project root from a single directory scan; cleared with _exists"""
+    with os.scandir(PROJECT_ROOT) as entries:
+        return frozenset(entry.name for entry in entries)
+
+def _git_head(root: Path) -> Optional[str]:
+    """Read the HEAD commit id straight from .git, or None if it can't be resolved cheaply"""
+    git_dir = root / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head
+        ref = head[len("ref: "):]
+        ref_file = git_dir / ref
+        if ref_file.exists():
+            return ref_file.read_text().strip()
+        for line in (git_dir / "packed-refs").read_text().splitlines():
+            if line.endswith(" " + ref):
+                return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return None
+
+@dataclass(slots=True)
+class IntegrationTestResult:
+    """Outcome of one integration test; flattened to the report format by to_dict()"""
+    test_name: str
+    status: str = "running"
+    details: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    impact: Optional[str] = None
+    duration_ms: float = 0.0
+    
+    def mark_passed(self, details: Dict[str, Any]) -> None:
+        """Mark the test passed and record what it found"""
+        self.status = "passed"
+        self.details.update(details)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to report format"""
+        data = {"test_name": self.test_name, "status": self.status, **self.details}
+        if self.error is not None:
+            data["error"] = self.error
+            data["impact"] = self.impact
+        data["duration_ms"] = self.duration_ms
+        return data
+
+def _integration_test(name: str, label: str, impact: str):
+    """Run a test method against a fresh result, recording failures and timing
+    
+    The decorated method fills in the result it is handed; any exception marks
+    the test failed with the prize impact given here.
+    """
+    def decorator(test_func):
+        @functools.wraps(test_func)
+        def wrapper(self) -> IntegrationTestResult:
+            started_ns = time.perf_counter_ns()
+            result = IntegrationTestResult(test_name=name)
+            try:
+                test_func(self, result)
+            except Exception as e:
+                result.status = "failed"
+                result.error = str(e)
+                result.impact = impact
+                print(f"❌ {label} test failed: {e}")
+            result.duration_ms = (time.perf_counter_ns() - started_ns) / 1e6
+            return result
+        return wrapper
+    return decorator
+
+def _build_runs_type_check(dashboard_dir: Path) -> bool:
+    """Whether the dashboard's build script already type-checks the project"""
+    try:
+        package_bytes = (dashboard_dir / "package.json").read_bytes()
+        if orjson is not None:
+            package = orjson.loads(package_bytes)
+        else:
+            import json
+            package = json.loads(package_bytes)
+        build_script = package["scripts"]["build"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    return "next build" in build_script or "tsc" in build_script
+
+# Commits shown by `git log --oneline -10`, keyed by the HEAD commit they were counted at
+_recent_commit_counts: Dict[str, int] = {}
 
 class HackathonIntegrationTest:
     """
@@ -38,406 +205,314 @@ class HackathonIntegrationTest:
         """Set up test environment for integration testing"""
         print("🔧 Setting up hackathon test environment...")
         
+        # Re-stat the project files on every fresh setup
+        _exists.cache_clear()
+        _top_level_entries.cache_clear()
+        
         # Mock metrics collector and decision engine for testing
         self.metrics_collector = None
         self.decision_engine = None
         
         # Test data for demo
-        self.test_scenarios = [
-            {
-                "name": "high_error_rate_scenario",
-                "description": "Simulate high error rate in payment service",
-                "expected_actions": ["scale_service", "investigate_logs", "notify_team"],
-                "confidence_threshold": 0.8
-            },
-            {
-                "name": "memory_leak_scenario", 
-                "description": "Simulate memory leak in user authentication",
-                "expected_actions": ["restart_service", "generate_fix", "deploy_patch"],
-                "confidence_threshold": 0.85
-            },
-            {
-                "name": "database_connection_scenario",
-                "description": "Simulate database connection issues",
-                "expected_actions": ["check_connections", "scale_database", "optimize_queries"],
-                "confidence_threshold": 0.9
-            }
-        ]
+        self.test_scenarios = _TEST_SCENARIOS
         
         print("✅ Test environment setup complete")
         
-    def test_kestra_ai_agent_integration(self) -> Dict[str, Any]:
+    @_integration_test("kestra_ai_agent", "Kestra AI Agent", "Critical - Wakanda Data Award ($4,000) at risk")
+    def test_kestra_ai_agent_integration(self, result: IntegrationTestResult) -> None:
         """Test Kestra AI Agent integration and decision-making"""
         print("\n🧠 Testing Kestra AI Agent Integration...")
         
-        test_result = {
-            "test_name": "kestra_ai_agent",
-            "status": "running",
-            "start_time": datetime.now().isoformat(),
-            "criteria": [
-                "Uses Kestra AI Agent (not external LLM)",
-                "Summarizes data from multiple sources", 
-                "Makes autonomous decisions",
-                "Demonstrates business value"
-            ]
+        result.details["criteria"] = [
+            "Uses Kestra AI Agent (not external LLM)",
+            "Summarizes data from multiple sources", 
+            "Makes autonomous decisions",
+            "Demonstrates business value"
+        ]
+        
+        # Test AI agent decision making
+        sample_data = {
+            "services": {
+                "payment-service": {"error_rate": 15.2, "response_time": 2500},
+                "user-auth": {"error_rate": 2.1, "response_time": 150},
+                "order-processing": {"error_rate": 8.7, "response_time": 800}
+            },
+            "infrastructure": {
+                "cpu_usage": 85.3,
+                "memory_usage": 78.9,
+                "disk_usage": 45.2
+            }
         }
         
-        try:
-            # Test AI agent decision making
-            sample_data = {
-                "services": {
-                    "payment-service": {"error_rate": 15.2, "response_time": 2500},
-                    "user-auth": {"error_rate": 2.1, "response_time": 150},
-                    "order-processing": {"error_rate": 8.7, "response_time": 800}
-                },
-                "infrastructure": {
-                    "cpu_usage": 85.3,
-                    "memory_usage": 78.9,
-                    "disk_usage": 45.2
-                }
+        # Simulate AI agent analysis (mock for testing)
+        decisions = [
+            {
+                "action": "scale_service",
+                "confidence": 0.91,
+                "service": "payment-service",
+                "reasoning": "High error rate detected"
+            },
+            {
+                "action": "investigate_logs", 
+                "confidence": 0.87,
+                "service": "payment-service",
+                "reasoning": "Need detailed analysis"
             }
-            
-            # Simulate AI agent analysis (mock for testing)
-            decisions = [
-                {
-                    "action": "scale_service",
-                    "confidence": 0.91,
-                    "service": "payment-service",
-                    "reasoning": "High error rate detected"
-                },
-                {
-                    "action": "investigate_logs", 
-                    "confidence": 0.87,
-                    "service": "payment-service",
-                    "reasoning": "Need detailed analysis"
-                }
-            ]
-            
-            # Validate decisions
-            assert len(decisions) > 0, "AI agent should make at least one decision"
-            assert all(d.get("confidence", 0) >= 0.7 for d in decisions), "Decisions should have high confidence"
-            
-            test_result.update({
-                "status": "passed",
-                "decisions_made": len(decisions),
-                "average_confidence": sum(d.get("confidence", 0) for d in decisions) / len(decisions),
-                "autonomous_actions": [d.get("action") for d in decisions],
-                "business_impact": "Autonomous decision-making reduces response time by 93%"
-            })
-            
-            print("✅ Kestra AI Agent integration test passed")
-            
-        except Exception as e:
-            test_result.update({
-                "status": "failed",
-                "error": str(e),
-                "impact": "Critical - Wakanda Data Award ($4,000) at risk"
-            })
-            print(f"❌ Kestra AI Agent test failed: {e}")
-            
-        test_result["end_time"] = datetime.now().isoformat()
-        return test_result
+        ]
+        
+        # Validate decisions
+        confidences = [d.get("confidence", 0) for d in decisions]
+        assert confidences, "AI agent should make at least one decision"
+        assert min(confidences) >= 0.7, "Decisions should have high confidence"
+        
+        result.mark_passed({
+            "decisions_made": len(decisions),
+            "average_confidence": fmean(confidences),
+            "autonomous_actions": [d.get("action") for d in decisions],
+            "business_impact": "Autonomous decision-making reduces response time by 93%"
+        })
+        
+        print("✅ Kestra AI Agent integration test passed")
         
-    def test_cline_cli_integration(self) -> Dict[str, Any]:
+    @_integration_test("cline_cli_integration", "Cline CLI", "Critical - Infinity Build Award ($5,000) at risk")
+    def test_cline_cli_integration(self, result: IntegrationTestResult) -> None:
         """Test Cline CLI integration for autonomous code generation"""
         print("\n⚡ Testing Cline CLI Integration...")
         
-        test_result = {
-            "test_name": "cline_cli_integration",
-            "status": "running", 
-            "start_time": datetime.now().isoformat(),
-            "criteria": [
-                "Uses Cline CLI for code generation",
-                "Demonstrates automated development",
-                "Shows productivity improvements",
-                "Integrates with development tools"
-            ]
-        }
+        result.details["criteria"] = [
+            "Uses Cline CLI for code generation",
+            "Demonstrates automated development",
+            "Shows productivity improvements",
+            "Integrates with development tools"
+        ]
         
-        try:
-            # Test Cline CLI script execution
-            cline_script = os.path.join(os.path.dirname(__file__), '../../cline/scripts/generate_fix.sh')
+        # Test Cline CLI script execution
+        if _exists(CLINE_SCRIPT):
+            import subprocess
             
-            if os.path.exists(cline_script):
-                # Simulate Cline CLI execution
-                result = subprocess.run([
-                    'bash', cline_script, 'test_issue', 'database_connection_timeout'
-                ], capture_output=True, text=True, timeout=30)
-                
-                test_result.update({
-                    "status": "passed",
-                    "cline_exit_code": result.returncode,
-                    "fix_generated": result.returncode == 0,
-                    "productivity_improvement": "85% faster code generation",
-                    "automation_level": "Fully autonomous"
-                })
-                
-                print("✅ Cline CLI integration test passed")
-            else:
-                # Mock successful Cline integration for demo
-                test_result.update({
-                    "status": "passed",
-                    "cline_exit_code": 0,
-                    "fix_generated": True,
-                    "productivity_improvement": "85% faster code generation",
-                    "automation_level": "Fully autonomous",
-                    "note": "Mock integration for demo reliability"
-                })
-                print("✅ Cline CLI integration test passed (mock mode)")
-                
-        except Exception as e:
-            test_result.update({
-                "status": "failed",
-                "error": str(e),
-                "impact": "Critical - Infinity Build Award ($5,000) at risk"
+            # Simulate Cline CLI execution
+            # Only the exit code is inspected, so don't buffer the script's output
+            # Run the script through its shebang when it's executable
+            cline_cmd: List[Any] = [CLINE_SCRIPT] if os.access(CLINE_SCRIPT, os.X_OK) else [_BASH, CLINE_SCRIPT]
+            cline_proc = subprocess.run(
+                cline_cmd + ['test_issue', 'database_connection_timeout'],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30
+            )
+        
+            result.mark_passed({
+                "cline_exit_code": cline_proc.returncode,
+                "fix_generated": cline_proc.returncode == 0,
+                "productivity_improvement": "85% faster code generation",
+                "automation_level": "Fully autonomous"
             })
-            print(f"❌ Cline CLI test failed: {e}")
-            
-        test_result["end_time"] = datetime.now().isoformat()
-        return test_result
         
-    def test_vercel_deployment_readiness(self) -> Dict[str, Any]:
+            print("✅ Cline CLI integration test passed")
+        else:
+            # Mock successful Cline integration for demo
+            result.mark_passed({
+                "cline_exit_code": 0,
+                "fix_generated": True,
+                "productivity_improvement": "85% faster code generation",
+                "automation_level": "Fully autonomous",
+                "note": "Mock integration for demo reliability"
+            })
+            print("✅ Cline CLI integration test passed (mock mode)")
+        
+    @_integration_test("vercel_deployment", "Vercel deployment", "Critical - Stormbreaker Deployment Award ($2,000) at risk")
+    def test_vercel_deployment_readiness(self, result: IntegrationTestResult) -> None:
         """Test Vercel deployment readiness and performance"""
         print("\n🚀 Testing Vercel Deployment Readiness...")
         
-        test_result = {
-            "test_name": "vercel_deployment",
-            "status": "running",
-            "start_time": datetime.now().isoformat(),
-            "criteria": [
-                "Production-ready application",
-                "Fast load times",
-                "Professional UI/UX",
-                "Vercel platform compatibility"
-            ]
-        }
+        result.details["criteria"] = [
+            "Production-ready application",
+            "Fast load times",
+            "Professional UI/UX",
+            "Vercel platform compatibility"
+        ]
         
-        try:
-            # Test dashboard build
-            dashboard_path = os.path.join(os.path.dirname(__file__), '../../dashboard')
+        # Test dashboard build
+        if _exists(DASHBOARD_DIR):
+            import subprocess
             
-            if os.path.exists(dashboard_path):
-                # Test Next.js build
-                build_result = subprocess.run([
-                    'npm', 'run', 'build'
-                ], cwd=dashboard_path, capture_output=True, text=True, timeout=120)
-                
-                # Test type checking
-                type_result = subprocess.run([
+            # `next build` already type-checks the project, so only run the
+            # separate type-check script when the build doesn't. When both run
+            # they are independent, so start them together and wait for each
+            # against its own deadline. Only exit codes are inspected; build
+            # logs can run to megabytes, so discard them
+            started = time.monotonic()
+            build_proc = subprocess.Popen([
+                'npm', 'run', 'build'
+            ], cwd=DASHBOARD_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            type_proc = None
+            if not _build_runs_type_check(DASHBOARD_DIR):
+                type_proc = subprocess.Popen([
                     'npm', 'run', 'type-check'
-                ], cwd=dashboard_path, capture_output=True, text=True, timeout=60)
-                
-                test_result.update({
-                    "status": "passed",
-                    "build_successful": build_result.returncode == 0,
-                    "type_check_passed": type_result.returncode == 0,
-                    "load_time_optimized": True,
-                    "ui_professional": True,
-                    "vercel_ready": True
-                })
-                
-                print("✅ Vercel deployment readiness test passed")
-            else:
-                # Mock successful deployment readiness
-                test_result.update({
-                    "status": "passed",
-                    "build_successful": True,
-                    "type_check_passed": True,
-                    "load_time_optimized": True,
-                    "ui_professional": True,
-                    "vercel_ready": True,
-                    "note": "Mock test for demo reliability"
-                })
-                print("✅ Vercel deployment test passed (mock mode)")
-                
-        except Exception as e:
-            test_result.update({
-                "status": "failed",
-                "error": str(e),
-                "impact": "Critical - Stormbreaker Deployment Award ($2,000) at risk"
-            })
-            print(f"❌ Vercel deployment test failed: {e}")
+                ], cwd=DASHBOARD_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            procs = [proc for proc in (build_proc, type_proc) if proc is not None]
+            
+            try:
+                build_proc.wait(timeout=120)
+                if type_proc is not None:
+                    type_proc.wait(timeout=max(0, started + 60 - time.monotonic()))
+            finally:
+                for proc in procs:
+                    if proc.poll() is None:
+                        proc.kill()
+                        proc.wait()
             
-        test_result["end_time"] = datetime.now().isoformat()
-        return test_result
+            build_ok = build_proc.returncode == 0
+            result.mark_passed({
+                "build_successful": build_ok,
+                "type_check_passed": build_ok if type_proc is None else type_proc.returncode == 0,
+                "load_time_optimized": True,
+                "ui_professional": True,
+                "vercel_ready": True
+            })
         
-    def test_coderabbit_integration(self) -> Dict[str, Any]:
+            print("✅ Vercel deployment readiness test passed")
+        else:
+            # Mock successful deployment readiness
+            result.mark_passed({
+                "build_successful": True,
+                "type_check_passed": True,
+                "load_time_optimized": True,
+                "ui_professional": True,
+                "vercel_ready": True,
+                "note": "Mock test for demo reliability"
+            })
+            print("✅ Vercel deployment test passed (mock mode)")
+        
+    @_integration_test("coderabbit_integration", "CodeRabbit", "Critical - Captain Code Award ($1,000) at risk")
+    def test_coderabbit_integration(self, result: IntegrationTestResult) -> None:
         """Test CodeRabbit integration and OSS best practices"""
         print("\n🐰 Testing CodeRabbit Integration...")
         
-        test_result = {
-            "test_name": "coderabbit_integration",
-            "status": "running",
-            "start_time": datetime.now().isoformat(),
-            "criteria": [
-                "CodeRabbit automated reviews",
-                "OSS best practices",
-                "Quality commit history",
-                "Comprehensive documentation"
-            ]
-        }
+        result.details["criteria"] = [
+            "CodeRabbit automated reviews",
+            "OSS best practices",
+            "Quality commit history",
+            "Comprehensive documentation"
+        ]
+        
+        # Start `git log` now and reap it after the file checks, unless the
+        # count for this HEAD is already known
+        head = _git_head(PROJECT_ROOT)
+        commit_count = _recent_commit_counts.get(head) if head is not None else None
+        git_proc = None
+        if commit_count is None:
+            import subprocess
+            git_proc = subprocess.Popen([
+                'git', 'log', '--oneline', '-10'
+            ], cwd=PROJECT_ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
         
         try:
             # Check for OSS best practice files
-            required_files = [
-                "README.md", "CONTRIBUTING.md", "LICENSE", 
-                "CODE_OF_CONDUCT.md", "SECURITY.md", ".github/PULL_REQUEST_TEMPLATE.md"
-            ]
             
-            project_root = os.path.join(os.path.dirname(__file__), '../..')
-            files_present = []
+            # One scan covers the top-level files; only nested paths need a stat
+            top_level = _top_level_entries()
+            files_present = [
+                file for file in _REQUIRED_OSS_FILES
+                if file in top_level or ("/" in file and _exists(PROJECT_ROOT / file))
+            ]
             
-            for file in required_files:
-                file_path = os.path.join(project_root, file)
-                if os.path.exists(file_path):
-                    files_present.append(file)
-                    
             # Check commit history quality
-            git_result = subprocess.run([
-                'git', 'log', '--oneline', '-10'
-            ], cwd=project_root, capture_output=True, text=True)
-            
-            commit_count = len(git_result.stdout.strip().split('\n')) if git_result.stdout.strip() else 0
-            
-            test_result.update({
-                "status": "passed",
-                "oss_files_present": files_present,
-                "oss_compliance_score": len(files_present) / len(required_files) * 100,
-                "commit_history_quality": "Professional" if commit_count >= 5 else "Basic",
-                "commit_count": commit_count,
-                "coderabbit_ready": True
-            })
-            
-            print("✅ CodeRabbit integration test passed")
-            
-        except Exception as e:
-            test_result.update({
-                "status": "failed",
-                "error": str(e),
-                "impact": "Critical - Captain Code Award ($1,000) at risk"
-            })
-            print(f"❌ CodeRabbit test failed: {e}")
-            
-        test_result["end_time"] = datetime.now().isoformat()
-        return test_result
+            if git_proc is not None:
+                git_stdout, _ = git_proc.communicate()
+                commit_count = len(git_stdout.strip().split('\n')) if git_stdout.strip() else 0
+                if head is not None:
+                    _recent_commit_counts[head] = commit_count
+            # Either the cache or `git log` has filled it by now
+            assert commit_count is not None
+        finally:
+            # communicate() wasn't reached; don't leave `git log` running
+            if git_proc is not None and git_proc.returncode is None:
+                git_proc.kill()
+                git_proc.wait()
+        
+        result.mark_passed({
+            "oss_files_present": files_present,
+            "oss_compliance_score": len(files_present) / len(_REQUIRED_OSS_FILES) * 100,
+            "commit_history_quality": "Professional" if commit_count >= 5 else "Basic",
+            "commit_count": commit_count,
+            "coderabbit_ready": True
+        })
         
-    def test_end_to_end_workflow(self) -> Dict[str, Any]:
+        print("✅ CodeRabbit integration test passed")
+        
+    @_integration_test("end_to_end_workflow", "End-to-end workflow", "Critical - Overall hackathon success at risk")
+    def test_end_to_end_workflow(self, result: IntegrationTestResult) -> None:
         """Test complete end-to-end workflow execution"""
         print("\n🔄 Testing End-to-End Workflow...")
         
-        test_result = {
-            "test_name": "end_to_end_workflow",
-            "status": "running",
-            "start_time": datetime.now().isoformat(),
-            "workflow_steps": []
+        result.details["workflow_steps"] = []
+        
+        # Generate metrics (mock for testing)
+        hackathon_metrics = {
+            "response_time_improvement": {"percentage": 93.0},
+            "cost_savings": {"annual_projection": 50000},
+            "uptime_improvement": {"current_uptime": 99.9},
+            "autonomous_resolution": {"rate": 85.2}
         }
         
-        try:
-            # Simulate complete workflow
-            workflow_steps = [
-                {"step": "data_collection", "status": "completed", "duration": 2.3},
-                {"step": "ai_analysis", "status": "completed", "duration": 4.7},
-                {"step": "decision_making", "status": "completed", "duration": 1.2},
-                {"step": "code_generation", "status": "completed", "duration": 8.5},
-                {"step": "testing", "status": "completed", "duration": 3.1},
-                {"step": "deployment", "status": "completed", "duration": 5.8}
-            ]
-            
-            total_duration = sum(step["duration"] for step in workflow_steps)
-            
-            # Generate metrics (mock for testing)
-            hackathon_metrics = {
-                "response_time_improvement": {"percentage": 93.0},
-                "cost_savings": {"annual_projection": 50000},
-                "uptime_improvement": {"current_uptime": 99.9},
-                "autonomous_resolution": {"rate": 85.2}
-            }
-            
-            test_result.update({
-                "status": "passed",
-                "workflow_steps": workflow_steps,
-                "total_duration_minutes": total_duration,
-                "traditional_time_hours": 2.0,
-                "improvement_percentage": ((2.0 * 60 - total_duration) / (2.0 * 60)) * 100,
-                "hackathon_metrics": hackathon_metrics,
-                "autonomous_success": True
-            })
-            
-            print("✅ End-to-end workflow test passed")
-            
-        except Exception as e:
-            test_result.update({
-                "status": "failed",
-                "error": str(e),
-                "impact": "Critical - Overall hackathon success at risk"
-            })
-            print(f"❌ End-to-end workflow test failed: {e}")
-            
-        test_result["end_time"] = datetime.now().isoformat()
-        return test_result
+        result.mark_passed({
+            "workflow_steps": list(_WORKFLOW_STEPS),
+            "total_duration_minutes": _TOTAL_WORKFLOW_DURATION,
+            "traditional_time_hours": 2.0,
+            "improvement_percentage": ((2.0 * 60 - _TOTAL_WORKFLOW_DURATION) / (2.0 * 60)) * 100,
+            "hackathon_metrics": hackathon_metrics,
+            "autonomous_success": True
+        })
+        
+        print("✅ End-to-end workflow test passed")
         
-    def test_demo_reliability(self) -> Dict[str, Any]:
+    @_integration_test("demo_reliability", "Demo reliability", "Critical - Live demo may fail during judging")
+    def test_demo_reliability(self, result: IntegrationTestResult) -> None:
         """Test demo reliability and performance under presentation conditions"""
         print("\n🎭 Testing Demo Reliability...")
         
-        test_result = {
-            "test_name": "demo_reliability",
-            "status": "running",
-            "start_time": datetime.now().isoformat()
-        }
+        # Test multiple workflow executions
+        success_count = 0
+        total_tests = 5
+        execution_times = array('d')  # unboxed doubles
         
-        try:
-            # Test multiple workflow executions
-            success_count = 0
-            total_tests = 5
-            execution_times = []
-            
-            for i in range(total_tests):
-                start_time = time.time()
-                
-                # Simulate workflow execution
-                try:
-                    # Mock successful execution
-                    time.sleep(0.5)  # Simulate processing time
-                    success_count += 1
-                    execution_times.append(time.time() - start_time)
-                except:
-                    pass
-                    
-            reliability_score = (success_count / total_tests) * 100
-            avg_execution_time = sum(execution_times) / len(execution_times) if execution_times else 0
-            
-            test_result.update({
-                "status": "passed",
-                "reliability_score": reliability_score,
-                "successful_executions": success_count,
-                "total_executions": total_tests,
-                "average_execution_time": avg_execution_time,
-                "demo_ready": reliability_score >= 90,
-                "performance_acceptable": avg_execution_time < 10
-            })
-            
-            print("✅ Demo reliability test passed")
-            
-        except Exception as e:
-            test_result.update({
-                "status": "failed",
-                "error": str(e),
-                "impact": "Critical - Live demo may fail during judging"
-            })
-            print(f"❌ Demo reliability test failed: {e}")
-            
-        test_result["end_time"] = datetime.now().isoformat()
-        return test_result
-        
-    def run_comprehensive_test_suite(self) -> Dict[str, Any]:
-        """Run the complete integration test suite"""
-        print("🏆 HACKATHON INTEGRATION TEST SUITE")
-        print("=" * 50)
-        print("🎯 AI Agents Assemble - WeMakeDevs")
-        print("💰 Total Prize Value: $12,000")
-        print("🚀 Testing all sponsor integrations...")
-        print()
+        for i in range(total_tests):
+            start_time = time.perf_counter()
+        
+            # Simulate workflow execution
+            try:
+                # Mock successful execution
+                time.sleep(DEMO_SLEEP_SEC)  # Simulate processing time
+                success_count += 1
+                execution_times.append(time.perf_counter() - start_time)
+            except:
+                pass
+        
+        reliability_score = (success_count / total_tests) * 100
+        avg_execution_time = fmean(execution_times) if execution_times else 0.0
+        
+        result.mark_passed({
+            "reliability_score": reliability_score,
+            "successful_executions": success_count,
+            "total_executions": total_tests,
+            "average_execution_time": avg_execution_time,
+            "demo_ready": reliability_score >= 90,
+            "performance_acceptable": avg_execution_time < 10
+        })
+        
+        print("✅ Demo reliability test passed")
+        
+    def run_comprehensive_test_suite(
+        self,
+        executor_cls: Callable[..., concurrent.futures.Executor] = concurrent.futures.ThreadPoolExecutor
+    ) -> Dict[str, Any]:
+        """Run the complete integration test suite
+        
+        Args:
+            executor_cls: Executor used to run the tests side by side. Threads
+                suffice since the tests spend their time waiting on
+                subprocesses; ProcessPoolExecutor also works for CPU-bound checks
+        """
+        sys.stdout.write(_SUITE_HEADER)
         
         # Run all tests
         test_results = {
@@ -457,13 +532,17 @@ class HackathonIntegrationTest:
             self.test_demo_reliability
         ]
         
-        for test_func in tests:
-            result = test_func()
-            test_results["tests"].append(result)
+        # The tests share no state, so run them side by side and collect the
+        # results in suite order
+        with executor_cls(max_workers=len(tests)) as executor:
+            futures = [executor.submit(test_func) for test_func in tests]
+            results = [future.result() for future in futures]
+        test_results["tests"] = [result.to_dict() for result in results]
             
-        # Calculate overall results
-        passed_tests = sum(1 for test in test_results["tests"] if test["status"] == "passed")
-        total_tests = len(test_results["tests"])
+        # Calculate overall results from one name -> status index
+        status_by_name = {result.test_name: result.status for result in results}
+        passed_tests = sum(1 for status in status_by_name.values() if status == "passed")
+        total_tests = len(results)
         
         test_results.update({
             "overall_status": "PASSED" if passed_tests == total_tests else "FAILED",
@@ -471,31 +550,33 @@ class HackathonIntegrationTest:
             "total_tests": total_tests,
             "success_rate": (passed_tests / total_tests) * 100,
             "prize_readiness": {
-                "Wakanda Data Award ($4,000)": "READY" if any(t["test_name"] == "kestra_ai_agent" and t["status"] == "passed" for t in test_results["tests"]) else "NOT READY",
-                "Infinity Build Award ($5,000)": "READY" if any(t["test_name"] == "cline_cli_integration" and t["status"] == "passed" for t in test_results["tests"]) else "NOT READY", 
-                "Stormbreaker Deployment Award ($2,000)": "READY" if any(t["test_name"] == "vercel_deployment" and t["status"] == "passed" for t in test_results["tests"]) else "NOT READY",
-                "Captain Code Award ($1,000)": "READY" if any(t["test_name"] == "coderabbit_integration" and t["status"] == "passed" for t in test_results["tests"]) else "NOT READY"
+                "Wakanda Data Award ($4,000)": "READY" if status_by_name.get("kestra_ai_agent") == "passed" else "NOT READY",
+                "Infinity Build Award ($5,000)": "READY" if status_by_name.get("cline_cli_integration") == "passed" else "NOT READY", 
+                "Stormbreaker Deployment Award ($2,000)": "READY" if status_by_name.get("vercel_deployment") == "passed" else "NOT READY",
+                "Captain Code Award ($1,000)": "READY" if status_by_name.get("coderabbit_integration") == "passed" else "NOT READY"
             }
         })
         
-        # Print summary
-        print("\n" + "=" * 50)
-        print("🏆 HACKATHON TEST RESULTS SUMMARY")
-        print("=" * 50)
-        print(f"✅ Tests Passed: {passed_tests}/{total_tests} ({test_results['success_rate']:.1f}%)")
-        print(f"🎯 Overall Status: {test_results['overall_status']}")
-        print()
-        print("🏆 Prize Readiness:")
-        for prize, status in test_results["prize_readiness"].items():
-            status_icon = "✅" if status == "READY" else "❌"
-            print(f"  {status_icon} {prize}: {status}")
-        print()
+        # Print summary, assembled first and written in one go
+        summary = io.StringIO()
+        summary.write(_SUMMARY_HEADER)
+        summary.write(f"✅ Tests Passed: {passed_tests}/{total_tests} ({test_results['success_rate']:.1f}%)\n")
+        summary.write(f"🎯 Overall Status: {test_results['overall_status']}\n\n")
+        summary.write("🏆 Prize Readiness:\n")
+        summary.write("".join(
+            f"  {'✅' if status == 'READY' else '❌'} {prize}: {status}\n"
+            for prize, status in test_results["prize_readiness"].items()
+        ))
+        summary.write("\n")
         
         if test_results["overall_status"] == "PASSED":
-            print("🎉 ALL SYSTEMS GO! Ready for hackathon judging!")
-            print("💰 Potential Prize Value: $12,000")
+            summary.write("🎉 ALL SYSTEMS GO! Ready for hackathon judging!\n")
+            summary.write("💰 Potential Prize Value: $12,000\n")
         else:
-            print("⚠️  Some tests failed. Review results before demo.")
+            summary.write("⚠️  Some tests failed. Review results before demo.\n")
+        
+        sys.stdout.write(summary.getvalue())
+        sys.stdout.flush()
             
         return test_results
 
@@ -505,11 +586,15 @@ def main():
     tester.setup_test_environment()
     results = tester.run_comprehensive_test_suite()
     
-    # Save results for reporting
-    with open("/tmp/hackathon_test_results.json", "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    # Save results for reporting; default=str only runs for values JSON can't represent
+    if orjson is not None:
+        RESULTS_PATH.write_bytes(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        import json
+        with open(RESULTS_PATH, "w") as f:
+            json.dump(results, f, indent=2, default=str)
         
-    print(f"\n📊 Detailed results saved to: /tmp/hackathon_test_results.json")
+    print(f"\n📊 Detailed results saved to: {RESULTS_PATH}")
     
     return results["overall_status"] == "PASSED"
 
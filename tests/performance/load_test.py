@@ -8,13 +8,99 @@ load and real-world production scenarios.
 Built for AI Agents Assemble Hackathon - Ensuring scalable performance
 """
 
+import asyncio
+import bisect
+import contextlib
 import time
 import json
-import statistics
 from datetime import datetime
-from typing import List, Dict, Any
-import concurrent.futures
-import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable, ContextManager, Awaitable
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib serializer
+    orjson = None  # type: ignore[assignment]
+
+RESULTS_PATH = Path("/tmp/hackathon_load_test_results.json")
+
+# Memory is polled often but a sample is only recorded once RSS has moved by
+# more than the threshold; CPU is sampled at its own, slower cadence
+_MEMORY_POLL_INTERVAL_SEC = 0.05
+_MEMORY_SAMPLE_THRESHOLD_BYTES = 1024 * 1024
+_CPU_SAMPLE_INTERVAL_SEC = 0.5
+
+# Sorted grade boundaries. For lower-is-better metrics a value under the first
+# boundary is EXCELLENT and under the second GOOD; for higher-is-better ones a
+# value above the second is EXCELLENT and above the first GOOD
+_GRADES = ("EXCELLENT", "GOOD", "NEEDS_IMPROVEMENT")
+_LOAD_TIME_GRADES = (1.0, 2.0)   # seconds
+_THROUGHPUT_GRADES = (2, 5)      # workflows per second, higher is better
+_MEMORY_GRADES = (100, 200)      # MB
+_CPU_GRADES = (20, 50)           # percent
+
+def _grade(value: float, boundaries: Tuple[float, float], higher_is_better: bool = False) -> str:
+    """Map a metric onto _GRADES using its sorted grade boundaries"""
+    if higher_is_better:
+        return _GRADES[len(boundaries) - bisect.bisect_left(boundaries, value)]
+    return _GRADES[bisect.bisect_right(boundaries, value)]
+
+# Messages each mock WebSocket connection receives
+_MOCK_MESSAGES_PER_CONNECTION = 10
+
+# Immutable payload shared by the memory test's synthetic records
+_PAYLOAD = tuple(range(100))
+
+@dataclass(slots=True)
+class _SampleStats:
+    """Single-pass count, mean, maximum and first value of a sample stream"""
+    count: int = 0
+    total: float = 0.0
+    maximum: float = float("-inf")
+    first: float = 0.0
+    
+    def add(self, value: float) -> None:
+        """Fold one sample into the running figures"""
+        if not self.count:
+            self.first = value
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+            
+    @property
+    def mean(self) -> float:
+        """Mean of the samples so far, 0.0 if there are none"""
+        return self.total / self.count if self.count else 0.0
+
+@dataclass(slots=True)
+class _WorkflowRecord:
+    """Synthetic workflow record produced by the memory test"""
+    workflow_id: str
+    data: Tuple[int, ...]
+    timestamp: str
+
+def _mock_load_time_stats(users: int) -> Tuple[float, float, float]:
+    """Mean, p95 and p99 of the mock dashboard load times, 0.8 + 0.1 * i seconds for user i
+    
+    The mock times form an arithmetic series, so the figures are computed in
+    closed form instead of from a materialized sample. The percentiles follow
+    the "exclusive" interpolation of statistics.quantiles.
+    """
+    if users <= 0:
+        return 0, 0, 0
+    if users == 1:
+        return 0.8, 0.8, 0.8
+    
+    def cut(i: int, n: int) -> float:
+        # Interpolate between order statistics j - 1 and j, as statistics.quantiles does
+        m = users + 1
+        j = min(max(i * m // n, 1), users - 1)
+        delta = i * m - j * n
+        return 0.8 + 0.1 * (j - 1) + 0.1 * delta / n
+    
+    return 0.8 + 0.05 * (users - 1), cut(19, 20), cut(99, 100)
 
 class HackathonLoadTester:
     """
@@ -34,80 +120,101 @@ class HackathonLoadTester:
             "hackathon_context": "AI Agents Assemble - WeMakeDevs",
             "performance_tests": []
         }
+        # Event loop reused by every run_load_tests() call until close()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+    def run_load_tests(self) -> Dict[str, Any]:
+        """Run the load testing suite on this tester's own event loop"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self.run_comprehensive_load_tests())
         
-    def test_dashboard_load_time(self, concurrent_users: int = 10) -> Dict[str, Any]:
+    def close(self):
+        """Close the tester's event loop"""
+        if self._loop is not None:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+            self._loop = None
+        
+    async def test_dashboard_load_time(self, concurrent_users: int = 10) -> Dict[str, Any]:
         """Test dashboard load time under concurrent user load (mock for testing)"""
         print(f"🚀 Testing dashboard load time with {concurrent_users} concurrent users...")
         
-        # Mock load testing results for demo reliability
-        load_times = [0.8 + (i * 0.1) for i in range(concurrent_users)]  # Simulated load times
+        # Mock load testing results for demo reliability; every simulated
+        # request succeeds
+        successful_requests = max(concurrent_users, 0)
         errors = 0
-            
-        # Calculate metrics
-        if load_times:
-            avg_load_time = statistics.mean(load_times)
-            p95_load_time = statistics.quantiles(load_times, n=20)[18] if len(load_times) > 1 else load_times[0]
-            p99_load_time = statistics.quantiles(load_times, n=100)[98] if len(load_times) > 1 else load_times[0]
-        else:
-            avg_load_time = p95_load_time = p99_load_time = 0
+        avg_load_time, p95_load_time, p99_load_time = _mock_load_time_stats(concurrent_users)
             
         test_result = {
             "test_name": "dashboard_load_time",
             "concurrent_users": concurrent_users,
-            "successful_requests": len(load_times),
+            "successful_requests": successful_requests,
             "failed_requests": errors,
-            "success_rate": (len(load_times) / concurrent_users) * 100,
+            "success_rate": (successful_requests / concurrent_users) * 100,
             "average_load_time": avg_load_time,
             "p95_load_time": p95_load_time,
             "p99_load_time": p99_load_time,
-            "performance_grade": "EXCELLENT" if avg_load_time < 1.0 else "GOOD" if avg_load_time < 2.0 else "NEEDS_IMPROVEMENT",
-            "hackathon_ready": avg_load_time < 3.0 and (len(load_times) / concurrent_users) > 0.9
+            "performance_grade": _grade(avg_load_time, _LOAD_TIME_GRADES),
+            "hackathon_ready": avg_load_time < 3.0 and (successful_requests / concurrent_users) > 0.9
         }
         
         print(f"✅ Dashboard load test completed: {test_result['performance_grade']}")
         return test_result
         
-    def test_workflow_throughput(self, duration_seconds: int = 60) -> Dict[str, Any]:
-        """Test workflow execution throughput over time"""
+    async def test_workflow_throughput(self, duration_seconds: int = 60, max_workers: int = 5) -> Dict[str, Any]:
+        """Test workflow execution throughput over time
+        
+        Args:
+            duration_seconds: How long to keep starting new workflows
+            max_workers: Maximum number of workflows executing at once
+        """
         print(f"⚡ Testing workflow throughput for {duration_seconds} seconds...")
         
+        # Only the mean execution time is reported, so keep a running total
+        # rather than every sample. The workflows are coroutines on one event
+        # loop, so the counters need no locking. Times are integer
+        # perf_counter_ns readings, converted to seconds only for the report
         workflow_executions = 0
         errors = 0
-        execution_times = []
-        start_time = time.time()
+        total_execution_ns = 0
+        start_ns = time.perf_counter_ns()
+        deadline_ns = start_ns + duration_seconds * 1_000_000_000
         
-        def execute_workflow():
-            nonlocal workflow_executions, errors
-            try:
-                # Simulate workflow execution
-                exec_start = time.time()
+        async def execute_workflow(workers: asyncio.Semaphore):
+            nonlocal workflow_executions, errors, total_execution_ns
+            async with workers:
+                try:
+                    # Simulate workflow execution
+                    exec_start_ns = time.perf_counter_ns()
+                    
+                    # Mock workflow steps with realistic timing
+                    await asyncio.sleep(0.1)  # Data collection
+                    await asyncio.sleep(0.2)  # AI analysis
+                    await asyncio.sleep(0.05) # Decision making
+                    await asyncio.sleep(0.15) # Action execution
+                    
+                    total_execution_ns += time.perf_counter_ns() - exec_start_ns
+                    workflow_executions += 1
+                    
+                except Exception as e:
+                    errors += 1
                 
-                # Mock workflow steps with realistic timing
-                time.sleep(0.1)  # Data collection
-                time.sleep(0.2)  # AI analysis
-                time.sleep(0.05) # Decision making
-                time.sleep(0.15) # Action execution
-                
-                exec_time = time.time() - exec_start
-                execution_times.append(exec_time)
-                workflow_executions += 1
-                
-            except Exception as e:
-                errors += 1
-                
-        # Run workflows concurrently for the specified duration
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
+        # Workflows beyond max_workers queue here, as they would for a
+        # fixed-size worker pool
+        workers = asyncio.Semaphore(max_workers)
+        
+        # Start workflows concurrently for the specified duration
+        workflows = []
+        
+        while time.perf_counter_ns() < deadline_ns:
+            workflows.append(asyncio.create_task(execute_workflow(workers)))
+            await asyncio.sleep(0.1)  # Small delay between workflow starts
             
-            while time.time() - start_time < duration_seconds:
-                future = executor.submit(execute_workflow)
-                futures.append(future)
-                time.sleep(0.1)  # Small delay between workflow starts
-                
-            # Wait for all workflows to complete
-            concurrent.futures.wait(futures)
+        # Wait for all workflows to complete
+        await asyncio.gather(*workflows)
             
-        total_time = time.time() - start_time
+        total_time = (time.perf_counter_ns() - start_ns) * 1e-9
         throughput = workflow_executions / total_time
         
         test_result = {
@@ -118,66 +225,117 @@ class HackathonLoadTester:
             "success_rate": (workflow_executions / (workflow_executions + errors)) * 100 if (workflow_executions + errors) > 0 else 0,
             "throughput_per_second": throughput,
             "throughput_per_minute": throughput * 60,
-            "average_execution_time": statistics.mean(execution_times) if execution_times else 0,
-            "performance_grade": "EXCELLENT" if throughput > 5 else "GOOD" if throughput > 2 else "NEEDS_IMPROVEMENT",
+            "average_execution_time": total_execution_ns * 1e-9 / workflow_executions if workflow_executions else 0,
+            "performance_grade": _grade(throughput, _THROUGHPUT_GRADES, higher_is_better=True),
             "hackathon_ready": throughput > 1 and (workflow_executions / (workflow_executions + errors)) > 0.95
         }
         
         print(f"✅ Workflow throughput test completed: {test_result['performance_grade']}")
         return test_result
         
-    def test_memory_usage(self, duration_seconds: int = 30) -> Dict[str, Any]:
-        """Test memory usage under sustained load"""
+    async def test_memory_usage(self, duration_seconds: int = 30, sample_cpu: bool = False) -> Dict[str, Any]:
+        """Test memory usage under sustained load
+        
+        Args:
+            duration_seconds: How long to monitor the process
+            sample_cpu: Also sample CPU usage; the CPU fields are None when off
+        """
         print(f"🧠 Testing memory usage for {duration_seconds} seconds...")
         
-        import psutil
         import os
         
-        process = psutil.Process(os.getpid())
-        memory_samples = []
-        cpu_samples = []
+        # Samples are reduced as they arrive rather than kept for later
+        memory_stats = _SampleStats()
+        cpu_stats = _SampleStats()
         
-        start_time = time.time()
+        # On Linux, read RSS straight from /proc/self/statm (resident pages are
+        # the second field) rather than through psutil on every poll
+        try:
+            statm = open("/proc/self/statm", "rb", buffering=0)
+        except OSError:
+            statm = None
+        page_size = os.sysconf("SC_PAGE_SIZE") if statm is not None else 1
         
-        # Simulate sustained load
-        def memory_monitor():
-            while time.time() - start_time < duration_seconds:
-                memory_info = process.memory_info()
-                cpu_percent = process.cpu_percent()
-                
-                memory_samples.append(memory_info.rss / 1024 / 1024)  # MB
-                cpu_samples.append(cpu_percent)
+        # psutil is only needed for CPU sampling or when statm isn't available
+        process: Any = None
+        snapshot: Callable[[], ContextManager[Any]] = contextlib.nullcontext
+        if sample_cpu or statm is None:
+            import psutil
+            process = psutil.Process(os.getpid())
+            snapshot = process.oneshot
+        
+        def read_rss() -> int:
+            if statm is None:
+                return process.memory_info().rss
+            statm.seek(0)
+            return int(statm.read().split()[1]) * page_size
+        
+        # Sample on the event loop itself: each tick schedules the next until
+        # the duration has elapsed, then resolves monitor_done. A tick that
+        # raises fails monitor_done instead, so the test can't wait forever
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        monitor_done = loop.create_future()
+        last_rss = None
+        next_cpu_sample = start_time
+        
+        def memory_tick():
+            nonlocal last_rss, next_cpu_sample, tick_handle
+            try:
+                now = loop.time()
+                if now - start_time >= duration_seconds:
+                    monitor_done.set_result(None)
+                    return
                 
-                time.sleep(0.5)
+                # Read both figures from one cached psutil snapshot
+                with snapshot():
+                    rss = read_rss()
+                    if sample_cpu and now >= next_cpu_sample:
+                        cpu_stats.add(process.cpu_percent())
+                        next_cpu_sample = now + _CPU_SAMPLE_INTERVAL_SEC
                 
-        # Run memory monitoring in background
-        monitor_thread = threading.Thread(target=memory_monitor)
-        monitor_thread.start()
-        
-        # Simulate application load
-        data_structures = []
-        for i in range(1000):
-            # Simulate data processing
-            data_structures.append({
-                "workflow_id": f"workflow_{i}",
-                "data": list(range(100)),
-                "timestamp": datetime.now().isoformat()
-            })
-            time.sleep(0.01)
+                # Only keep memory samples that moved noticeably
+                if last_rss is None or abs(rss - last_rss) > _MEMORY_SAMPLE_THRESHOLD_BYTES:
+                    memory_stats.add(rss / 1024 / 1024)  # MB
+                    last_rss = rss
+            except BaseException as e:
+                monitor_done.set_exception(e)
+                return
+            
+            tick_handle = loop.call_later(_MEMORY_POLL_INTERVAL_SEC, memory_tick)
             
-        monitor_thread.join()
+        # Start memory monitoring, then simulate sustained load
+        tick_handle = loop.call_soon(memory_tick)
+        try:
+            # Simulate application load; every record shares one payload and
+            # timestamp so the loop measures record churn, not their construction
+            data_structures = []
+            now_iso = datetime.now().isoformat()
+            for i in range(1000):
+                # Simulate data processing
+                data_structures.append(_WorkflowRecord(f"workflow_{i}", _PAYLOAD, now_iso))
+                if i & 0xff == 0:
+                    await asyncio.sleep(0)  # let the monitor and other tests run
+                
+            await monitor_done
+        finally:
+            tick_handle.cancel()
+            if statm is not None:
+                statm.close()
         
         # Calculate memory metrics
-        if memory_samples:
-            avg_memory = statistics.mean(memory_samples)
-            max_memory = max(memory_samples)
-            memory_growth = max_memory - memory_samples[0] if len(memory_samples) > 1 else 0
+        if memory_stats.count:
+            avg_memory = memory_stats.mean
+            max_memory = memory_stats.maximum
+            memory_growth = max_memory - memory_stats.first if memory_stats.count > 1 else 0
         else:
             avg_memory = max_memory = memory_growth = 0
             
-        if cpu_samples:
-            avg_cpu = statistics.mean(cpu_samples)
-            max_cpu = max(cpu_samples)
+        if not sample_cpu:
+            avg_cpu = max_cpu = None
+        elif cpu_stats.count:
+            avg_cpu = cpu_stats.mean
+            max_cpu = cpu_stats.maximum
         else:
             avg_cpu = max_cpu = 0
             
@@ -189,22 +347,22 @@ class HackathonLoadTester:
             "memory_growth_mb": memory_growth,
             "average_cpu_percent": avg_cpu,
             "max_cpu_percent": max_cpu,
-            "memory_efficiency": "EXCELLENT" if avg_memory < 100 else "GOOD" if avg_memory < 200 else "NEEDS_IMPROVEMENT",
-            "cpu_efficiency": "EXCELLENT" if avg_cpu < 20 else "GOOD" if avg_cpu < 50 else "NEEDS_IMPROVEMENT",
-            "hackathon_ready": avg_memory < 500 and avg_cpu < 80
+            "memory_efficiency": _grade(avg_memory, _MEMORY_GRADES),
+            "cpu_efficiency": "N/A" if avg_cpu is None else _grade(avg_cpu, _CPU_GRADES),
+            "hackathon_ready": avg_memory < 500 and (avg_cpu is None or avg_cpu < 80)
         }
         
         print(f"✅ Memory usage test completed: {test_result['memory_efficiency']}")
         return test_result
         
-    def test_websocket_connections(self, concurrent_connections: int = 20) -> Dict[str, Any]:
+    async def test_websocket_connections(self, concurrent_connections: int = 20) -> Dict[str, Any]:
         """Test WebSocket connection handling for real-time updates (mock for testing)"""
         print(f"🔌 Testing WebSocket connections with {concurrent_connections} concurrent connections...")
         
         # Mock WebSocket testing results
         successful_connections = concurrent_connections
         failed_connections = 0
-        message_counts = [10] * concurrent_connections  # All connections receive 10 messages
+        connected = max(concurrent_connections, 0)  # All connections receive the same messages
         
         test_result = {
             "test_name": "websocket_connections",
@@ -212,8 +370,8 @@ class HackathonLoadTester:
             "successful_connections": successful_connections,
             "failed_connections": failed_connections,
             "connection_success_rate": (successful_connections / concurrent_connections) * 100,
-            "average_messages_per_connection": statistics.mean(message_counts) if message_counts else 0,
-            "total_messages_processed": sum(message_counts),
+            "average_messages_per_connection": _MOCK_MESSAGES_PER_CONNECTION if connected else 0,
+            "total_messages_processed": _MOCK_MESSAGES_PER_CONNECTION * connected,
             "performance_grade": "EXCELLENT" if successful_connections == concurrent_connections else "GOOD" if successful_connections > concurrent_connections * 0.9 else "NEEDS_IMPROVEMENT",
             "hackathon_ready": successful_connections > concurrent_connections * 0.95
         }
@@ -221,7 +379,7 @@ class HackathonLoadTester:
         print(f"✅ WebSocket test completed: {test_result['performance_grade']}")
         return test_result
         
-    def run_comprehensive_load_tests(self) -> Dict[str, Any]:
+    async def run_comprehensive_load_tests(self) -> Dict[str, Any]:
         """Run comprehensive load testing suite"""
         print("🏆 HACKATHON PERFORMANCE LOAD TESTS")
         print("=" * 50)
@@ -229,26 +387,43 @@ class HackathonLoadTester:
         print("⚡ Testing platform performance and scalability...")
         print()
         
+        # Stamp this run's start and end from one bound clock. Each run gets
+        # a fresh results dict, so a reused tester neither reports earlier
+        # runs' tests nor mutates the dict an earlier run returned
+        now = datetime.now
+        self.results = {
+            "test_start": now().isoformat(),
+            "hackathon_context": self.results["hackathon_context"],
+            "performance_tests": []
+        }
+        
         # Run all performance tests
-        tests = [
+        tests: List[Tuple[str, Callable[..., Awaitable[Dict[str, Any]]], List[int]]] = [
             ("Dashboard Load Time", self.test_dashboard_load_time, [10]),
             ("Workflow Throughput", self.test_workflow_throughput, [30]),
             ("Memory Usage", self.test_memory_usage, [20]),
             ("WebSocket Connections", self.test_websocket_connections, [15])
         ]
         
-        for test_name, test_func, args in tests:
+        # The tests are independent, so run them all at once; wall time is
+        # that of the longest test rather than the sum
+        for test_name, _, _ in tests:
             print(f"Running {test_name}...")
-            try:
-                result = test_func(*args)
-                self.results["performance_tests"].append(result)
-            except Exception as e:
-                print(f"❌ {test_name} failed: {e}")
+        outcomes = await asyncio.gather(
+            *(test_func(*args) for _, test_func, args in tests),
+            return_exceptions=True
+        )
+        
+        for (test_name, _, _), result in zip(tests, outcomes):
+            if isinstance(result, BaseException):
+                print(f"❌ {test_name} failed: {result}")
                 self.results["performance_tests"].append({
                     "test_name": test_name.lower().replace(" ", "_"),
                     "status": "failed",
-                    "error": str(e)
+                    "error": str(result)
                 })
+            else:
+                self.results["performance_tests"].append(result)
                 
         # Calculate overall performance score
         hackathon_ready_tests = sum(1 for test in self.results["performance_tests"] 
@@ -256,7 +431,7 @@ class HackathonLoadTester:
         total_tests = len(self.results["performance_tests"])
         
         self.results.update({
-            "test_completion_time": datetime.now().isoformat(),
+            "test_completion_time": now().isoformat(),
             "overall_performance_score": (hackathon_ready_tests / total_tests) * 100,
             "hackathon_ready": hackathon_ready_tests == total_tests,
             "performance_summary": {
@@ -291,13 +466,20 @@ class HackathonLoadTester:
 def main():
     """Main function to run load tests"""
     tester = HackathonLoadTester()
-    results = tester.run_comprehensive_load_tests()
+    try:
+        results = tester.run_load_tests()
+    finally:
+        tester.close()
     
-    # Save results
-    with open("/tmp/hackathon_load_test_results.json", "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    # Save results; every value is already a JSON-native type (timestamps are
+    # ISO strings, errors are str), so no default= fallback is needed
+    if orjson is not None:
+        RESULTS_PATH.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(RESULTS_PATH, "w") as f:
+            json.dump(results, f, indent=2)
         
-    print(f"\n📊 Detailed results saved to: /tmp/hackathon_load_test_results.json")
+    print(f"\n📊 Detailed results saved to: {RESULTS_PATH}")
     
     return results["hackathon_ready"]
 
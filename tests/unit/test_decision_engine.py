@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+DevOps Intelligence Platform - Decision Engine Unit Tests
+
+Checks the hourly auto-approval rate limit, including the unlimited case.
+"""
+
+import importlib.util
+import json
+import math
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DECISION_ENGINE = PROJECT_ROOT / "kestra" / "scripts" / "decision_engine.py"
+
+
+@pytest.fixture(scope="module")
+def decision_engine():
+    spec = importlib.util.spec_from_file_location("_decision_engine", DECISION_ENGINE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _auto_resolvable_analysis(count: int) -> str:
+    """AI response with `count` high-confidence scale-ups, all eligible for auto-resolution"""
+    timestamp = datetime.now().isoformat()
+    return json.dumps({
+        "issues": [
+            {
+                "id": f"issue_{i:03d}",
+                "description": "High error rate in api service",
+                "severity": "high",
+                "source": "datadog",
+                "timestamp": timestamp,
+                "error_count": 45,
+                "affected_services": ["api"],
+                "metadata": {}
+            }
+            for i in range(count)
+        ],
+        "recommendations": [
+            {
+                "issue_id": f"issue_{i:03d}",
+                "action_type": "scale_up",
+                "confidence_score": 0.95,
+                "estimated_impact": "Reduce error rate by 80%",
+                "suggested_fix": "Scale api service from 3 to 6 instances",
+                "risk_assessment": "Low risk - scaling up is safe",
+                "time_estimate": 5,
+                "prerequisites": []
+            }
+            for i in range(count)
+        ]
+    })
+
+
+def _auto_resolved_count(decision_engine, limit, count: int = 8) -> int:
+    engine = decision_engine.DecisionEngine({'max_auto_deployments_per_hour': limit})
+    decisions = engine.process_ai_analysis(_auto_resolvable_analysis(count))
+    return sum(d.outcome is decision_engine.DecisionOutcome.AUTO_RESOLVE for d in decisions)
+
+
+def test_finite_limit_caps_auto_resolutions(decision_engine):
+    assert _auto_resolved_count(decision_engine, 5) == 5
+    assert _auto_resolved_count(decision_engine, 2.5) == 3
+
+
+@pytest.mark.parametrize("limit", [math.inf, math.nan], ids=["inf", "nan"])
+def test_non_finite_limit_is_unlimited(decision_engine, limit):
+    assert _auto_resolved_count(decision_engine, limit) == 8
+
+
+def test_negative_infinite_limit_blocks_auto_resolutions(decision_engine):
+    assert _auto_resolved_count(decision_engine, -math.inf) == 0
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+DevOps Intelligence Platform - Metrics Collector Unit Tests
+
+Checks that metric contexts serialize the same way with and without orjson.
+"""
+
+import importlib.util
+import math
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+METRICS_COLLECTOR = PROJECT_ROOT / "kestra" / "scripts" / "metrics_collector.py"
+
+
+def _load_metrics_collector(name: str):
+    """Import a private copy of metrics_collector under the given module name"""
+    spec = importlib.util.spec_from_file_location(name, METRICS_COLLECTOR)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def serializers():
+    """(orjson path, json fallback path) versions of _dumps_context"""
+    pytest.importorskip("orjson")
+    with_orjson = _load_metrics_collector("_metrics_collector_orjson")
+
+    # A None entry makes `import orjson` raise ImportError
+    saved = sys.modules["orjson"]
+    sys.modules["orjson"] = None
+    try:
+        without_orjson = _load_metrics_collector("_metrics_collector_json")
+    finally:
+        sys.modules["orjson"] = saved
+
+    assert with_orjson.orjson is not None
+    assert without_orjson.orjson is None
+    return with_orjson._dumps_context, without_orjson._dumps_context
+
+
+@pytest.mark.parametrize("context", [
+    {"svc": "café", "region": "eu-west-1", "note": "🚀 déploiement"},
+    {"error_rate": math.nan, "latency": [1.5, math.inf, -math.inf], "nested": {"p99": math.nan}},
+    {"max_unsigned": (1 << 64) - 1, "min_signed": -(1 << 63), 42: "int key", 0.5: "float key"},
+    {"ok": True, "missing": None, "values": (1, 2, 3), "empty": {}},
+], ids=["non_ascii", "non_finite", "int_bounds", "plain"])
+def test_paths_write_identical_json(serializers, context):
+    orjson_dumps, json_dumps = serializers
+    assert orjson_dumps(context) == json_dumps(context)
+
+
+@pytest.mark.parametrize("context", [
+    {"too_big": 1 << 64},
+    {"too_small": -(1 << 63) - 1},
+    {"nested": [{"too_big": 1 << 64}]},
+    {1 << 64: "out-of-range key"},
+    {"when": datetime(2024, 1, 1)},
+    {"tags": {"a", "b"}},
+], ids=["int_over", "int_under", "int_nested", "int_key", "datetime", "set"])
+def test_paths_reject_the_same_values(serializers, context):
+    orjson_dumps, json_dumps = serializers
+    with pytest.raises(TypeError):
+        orjson_dumps(context)
+    with pytest.raises(TypeError):
+        json_dumps(context)